@@ -43,11 +43,13 @@ class BlankPageDetector:
         if not self.enabled:
             self.logger.warning("PIL/Pillow not available - blank page detection disabled")
     
-    def is_blank(self, image_path: str) -> bool:
+    def is_blank(self, image_path: str, image=None) -> bool:
         """Check if an image is blank.
         
         Args:
             image_path: Path to image file
+            image: Optional already opened PIL image of image_path, analysed
+                instead of opening and decoding the file again
             
         Returns:
             True if image is considered blank
@@ -56,52 +58,59 @@ class BlankPageDetector:
             self.logger.debug(f"Blank detection disabled, keeping file: {image_path}")
             return False
         
-        if not os.path.exists(image_path):
-            self.logger.warning(f"Image file not found: {image_path}")
-            return False
-        
         try:
-            # Open image and convert to grayscale
+            if image is not None:
+                return self._is_blank_image(image_path, image)
+
             with Image.open(image_path) as img:  # type: ignore
-                # Convert to grayscale for analysis
-                if img.mode != 'L':
-                    img = img.convert('L')
-                
-                # Get image statistics
-                stat = ImageStat.Stat(img)  # type: ignore
-                
-                # Calculate percentage of non-white pixels
-                # White threshold is configurable (default 250 out of 255)
-                white_threshold = self.config.white_threshold
-                
-                # Method 1: Mean pixel brightness
-                mean_brightness = stat.mean[0]
-                white_ratio = mean_brightness / 255.0
-                
-                # Method 2: Count pixels above threshold
-                # This is more accurate but slower
-                pixels = list(img.getdata())
-                non_white_pixels = sum(1 for pixel in pixels if pixel < white_threshold)
-                non_white_ratio = non_white_pixels / len(pixels)
-                
-                self.logger.debug(f"Image {os.path.basename(image_path)}: "
-                                f"mean_brightness={mean_brightness:.1f}, "
-                                f"white_ratio={white_ratio:.3f}, "
-                                f"non_white_ratio={non_white_ratio:.3f}")
-                
-                # Use non-white ratio for decision (more reliable)
-                is_blank = non_white_ratio <= self.config.blank_threshold
-                
-                if is_blank:
-                    self.logger.info(f"Detected blank page: {os.path.basename(image_path)} "
-                                   f"(non-white ratio: {non_white_ratio:.3f})")
-                
-                return is_blank
-                
+                # JPEG can decode straight to grayscale, skipping chroma
+                img.draft('L', img.size)
+                return self._is_blank_image(image_path, img)
+
+        except FileNotFoundError:
+            self.logger.warning(f"Image file not found: {image_path}")
+            return False
         except Exception as e:
             self.logger.error(f"Error analyzing image {image_path}: {e}")
             # On error, assume not blank to avoid losing data
             return False
+
+    def _is_blank_image(self, image_path: str, img) -> bool:
+        """Blank check on an opened image; see is_blank()."""
+        # Convert to grayscale for analysis
+        if img.mode != 'L':
+            img = img.convert('L')
+
+        # One pass over the pixels: every statistic below comes from the
+        # 256-bin grayscale histogram
+        histogram = img.histogram()
+        stat = ImageStat.Stat(histogram)  # type: ignore
+
+        # Calculate percentage of non-white pixels
+        # White threshold is configurable (default 250 out of 255)
+        white_threshold = self.config.white_threshold
+
+        # Method 1: Mean pixel brightness
+        mean_brightness = stat.mean[0]
+        white_ratio = mean_brightness / 255.0
+
+        # Method 2: Count pixels below threshold
+        non_white_pixels = sum(histogram[:white_threshold])
+        non_white_ratio = non_white_pixels / stat.count[0]
+
+        self.logger.debug(f"Image {os.path.basename(image_path)}: "
+                        f"mean_brightness={mean_brightness:.1f}, "
+                        f"white_ratio={white_ratio:.3f}, "
+                        f"non_white_ratio={non_white_ratio:.3f}")
+
+        # Use non-white ratio for decision (more reliable)
+        is_blank = non_white_ratio <= self.config.blank_threshold
+
+        if is_blank:
+            self.logger.info(f"Detected blank page: {os.path.basename(image_path)} "
+                           f"(non-white ratio: {non_white_ratio:.3f})")
+
+        return is_blank
     
     def filter_blank_pages(self, image_files: List[str]) -> Tuple[List[str], List[str]]:
         """Filter out blank pages from a list of image files.
@@ -174,7 +183,7 @@ class BlankPageDetector:
                     info['format'] = img.format
                     
                     # Add blank detection info
-                    info['is_blank'] = self.is_blank(image_path)
+                    info['is_blank'] = self.is_blank(image_path, image=img)
                     
                     # Calculate statistics
                     if img.mode != 'L':
@@ -84,7 +84,7 @@ class ButtonDetector:
         try:
             result = subprocess.run([
                 'scanimage', '-d', self.config.scanner_device, '-A'
-            ], capture_output=True, text=True, timeout=5)
+            ], capture_output=True, text=True, timeout=5, close_fds=False)
             
             if result.returncode == 0:
                 # Look for button-related options
@@ -121,7 +121,7 @@ class ButtonDetector:
             # Check if scanbd is running
             result = subprocess.run([
                 'systemctl', 'is-active', 'scanbd'
-            ], capture_output=True, text=True, timeout=3)
+            ], capture_output=True, text=True, timeout=3, close_fds=False)
             
             if result.returncode == 0:
                 return {
@@ -141,7 +141,7 @@ class ButtonDetector:
             try:
                 result = subprocess.run([
                     'pgrep', '-f', 'scanbd'
-                ], capture_output=True, text=True, timeout=3)
+                ], capture_output=True, text=True, timeout=3, close_fds=False)
                 
                 if result.returncode == 0:
                     return {
@@ -217,7 +217,7 @@ curl -X POST http://localhost:5000/scan
         try:
             result = subprocess.run([
                 'scanimage', '-d', self.config.scanner_device, '-A'
-            ], capture_output=True, text=True, timeout=10)
+            ], capture_output=True, text=True, timeout=10, close_fds=False)
             
             if result.returncode == 0:
                 options = {
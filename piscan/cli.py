@@ -6,6 +6,7 @@ import sys
 import signal
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 # Import components with fallbacks
@@ -17,6 +18,7 @@ FileManager = None
 BlankPageDetector = None
 Uploader = None
 UploadError = Exception
+_dumps = None
 ScanServer = None
 TestScan = None
 ButtonDetector = None
@@ -47,7 +49,7 @@ except ImportError:
     pass
 
 try:
-    from .uploader import Uploader, UploadError
+    from .uploader import Uploader, UploadError, _dumps
 except ImportError:
     pass
 
@@ -241,28 +243,23 @@ class ScanManager:
             doc_id_result = None
             page_count = [0]  # Use list to allow modification in callback
             upload_errors = []
+            # Serialized like upload_document() does, so both send the same bytes
+            meta_json = _dumps(metadata) if metadata else None
+            props_json = _dumps(properties) if properties else None
             
-            def page_ready_callback(page_num, filepath):
-                """Called when each page is scanned - upload immediately."""
-                if not upload:
-                    return
-                
+            def upload_page(page_num, filepath):
+                """Create the document with page 1, append any later page."""
+                nonlocal doc_id_result
+
                 try:
-                    nonlocal doc_id_result
-                    
-                    # Skip blank pages if configured
-                    if self.config.skip_blank:
-                        is_blank = self.blank_detector.is_blank(filepath)
-                        if is_blank:
-                            self.logger.info(f"Page {page_num} is blank, skipping upload")
-                            self.blank_detector.remove_blank_files([filepath])
-                            return
-                    
                     if page_num == 1:
                         # Create document with first page
                         self.logger.info(f"Creating document with page {page_num}")
                         result = self.uploader._create_document(
-                            [filepath], doc_id, metadata, document_type, properties
+                            [filepath], doc_id,
+                            document_type=document_type,
+                            meta_json=meta_json,
+                            props_json=props_json,
                         )
                         doc_id_result = result.get('doc_id')
                         self.logger.info(f"Document created: {doc_id_result}")
@@ -270,16 +267,51 @@ class ScanManager:
                     else:
                         # Append subsequent pages
                         if doc_id_result:
-                            self.logger.info(f"Appending page {page_num}")
-                            self.uploader._append_pages(doc_id_result, [filepath])
+                            self.logger.info(f"Queueing page {page_num} for append")
+                            self.uploader.append_pages_buffered(
+                                doc_id_result, filepath,
+                                flush_size=self.config.upload_append_flush_pages,
+                                flush_interval=self.config.upload_append_flush_interval,
+                            )
                             page_count[0] += 1
                 except Exception as e:
                     self.logger.error(f"Upload error for page {page_num}: {e}")
                     upload_errors.append(str(e))
-            
-            # Scan pages with callback for concurrent upload
+
+            def page_ready_callback(page_num, filepath):
+                """Called when each page is scanned - queue it for upload."""
+                if not upload:
+                    return
+
+                try:
+                    # Skip blank pages if configured
+                    if self.config.skip_blank:
+                        is_blank = self.blank_detector.is_blank(filepath)
+                        if is_blank:
+                            self.logger.info(f"Page {page_num} is blank, skipping upload")
+                            self.blank_detector.remove_blank_files([filepath])
+                            return
+
+                    upload_pool.submit(upload_page, page_num, filepath)
+                except Exception as e:
+                    self.logger.error(f"Upload error for page {page_num}: {e}")
+                    upload_errors.append(str(e))
+
+            # Scan pages with callback for concurrent upload. Uploads run on a
+            # single background worker so the scanner is never blocked on the
+            # network, while appends stay in page order behind page 1. Leaving
+            # the block waits for every queued upload, also when scanning fails.
             callback = page_ready_callback if upload else None
-            scanned_files = self.scanner.scan_pages(scan_dir, source, page_callback=callback)
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='piscan-upload') as upload_pool:
+                scanned_files = self.scanner.scan_pages(scan_dir, source, page_callback=callback)
+
+            # Send pages still waiting in the append buffer
+            if upload:
+                try:
+                    self.uploader.flush()
+                except Exception as e:
+                    self.logger.error(f"Upload error for remaining pages: {e}")
+                    upload_errors.append(str(e))
             
             if not scanned_files:
                 raise Exception("No pages were scanned")
@@ -375,6 +407,8 @@ class ScanManager:
         self.logger.info("Shutting down piscan")
         self.shutdown_event.set()
         self.stop_server()
+        self.scanner.close()
+        self.uploader.close()
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -1,9 +1,28 @@
 """Configuration management for piscan."""
 
+import copy
+import functools
 import os
 import yaml
 from typing import Dict, Any, Optional
 
+try:
+    # libyaml C parser, several times faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+@functools.lru_cache(maxsize=4)
+def _read_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file, cached per (path, mtime) so unchanged files are parsed once.
+
+    Callers must not modify the returned dictionary.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
 
 class Config:
     """Configuration manager for piscan."""
@@ -18,13 +37,18 @@ class Config:
             "color_correction": "none",  # none, swap_rb, swap_rg, swap_gb, rotate_left, rotate_right
             "paper_size": "A4",  # A4, Letter, Max, or explicit geometry options
             "mirror_simplex": False,  # Mirror image for simplex scans (ADF Front) if needed
+            "backend": "scanimage",  # scanimage (one process per scan) or sane (persistent python-sane handle)
+            "recompress": False,  # Re-encode JPEG pages as progressive JPEG right after scanning
+            "recompress_quality": 85,  # JPEG quality for recompress (1-100)
         },
 
         "api": {
             "workspace": "default",
             "url": "http://localhost:8080",
             "token": "",
-            "timeout": 30
+            "timeout": 30,
+            "log_connect_timeout": 2.0,  # Connect timeout for best-effort API error logging
+            "log_read_timeout": 4.0  # Read timeout for best-effort API error logging
         },
         "storage": {
             "temp_dir": "/tmp",
@@ -61,12 +85,21 @@ class Config:
             "compression": "individual",  # individual, zip
             "image_quality": 90,  # JPEG quality (1-100)
             "optimize_png": True,  # Optimize PNG files
+            "jpeg_optimize": False,  # Extra Huffman-optimization pass when saving JPEGs
             "zip_bundle_size": 6,  # Max files per ZIP bundle (0 = unlimited)
             "zip_bundle_max_bytes": 0,  # Max ZIP payload bytes per bundle (0 = unlimited)
             "zip_compression_level": 6,  # ZIP compression level (1-9, 9 = best compression)
+            "compression_algo": "deflate",  # ZIP entry codec: deflate, zstd-fast, zstd-balanced, zstd-max
+            "zip_streaming": False,  # Build ZIP bundles while uploading instead of via a temp file (needs isal)
+            "append_batch": False,  # Individual mode: append several pages per request (zip_bundle_* limits)
+            "append_flush_pages": 1,  # Scan-time appends: send buffered pages once this many are queued (>1 needs a server that accepts multiple files per append)
+            "append_flush_interval": 2.0,  # Scan-time appends: send buffered pages after this many seconds
+            "use_sendfile": False,  # Send page files with sendfile(2) (plain http:// API URLs only)
+            "parallel_prepare": False,  # Optimize/convert pages for ZIP upload in a process pool
             "auto_jpeg_threshold": 0,  # Auto-convert to JPEG if page count exceeds this (0 = disabled)
             "auto_jpeg_page_size_bytes": 0,  # Auto-convert large pages to JPEG (0 = disabled)
-            "max_image_dimension": 0  # Max dimension for images (0 = unlimited, reduces size for large docs)
+            "max_image_dimension": 0,  # Max dimension for images (0 = unlimited, reduces size for large docs)
+            "fast_resize": True  # Use area/reducing_gap resampling for downscales by more than half
         }
     }
     
@@ -77,7 +110,7 @@ class Config:
             config_path: Path to YAML config file
         """
         self.config_path = config_path or self._get_default_config_path()
-        self._config = self.DEFAULT_CONFIG.copy()
+        self._config = copy.deepcopy(self.DEFAULT_CONFIG)
         self._load_config()
     
     def _get_default_config_path(self) -> str:
@@ -106,8 +139,8 @@ class Config:
         """Load configuration from YAML file."""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    user_config = yaml.safe_load(f) or {}
+                mtime_ns = os.stat(self.config_path).st_mtime_ns
+                user_config = copy.deepcopy(_read_yaml(self.config_path, mtime_ns))
                 self._merge_config(self._config, user_config)
             except Exception as e:
                 print(f"Warning: Failed to load config from {self.config_path}: {e}")
@@ -209,6 +242,21 @@ class Config:
         """Mirror image for simplex scans."""
         return self.get('scanner.mirror_simplex', False)
 
+    @property
+    def scanner_backend(self) -> str:
+        """Scan backend: scanimage or sane."""
+        return str(self.get('scanner.backend', 'scanimage')).lower()
+
+    @property
+    def scanner_recompress(self) -> bool:
+        """Whether scanned JPEG pages are re-encoded before upload."""
+        return bool(self.get('scanner.recompress', False))
+
+    @property
+    def scanner_recompress_quality(self) -> int:
+        """JPEG quality used when recompressing scanned pages."""
+        return int(self.get('scanner.recompress_quality', 85))
+
     @property
     def api_workspace(self) -> str:
 
@@ -230,6 +278,16 @@ class Config:
         """Get API request timeout."""
         return self.get('api.timeout')
     
+    @property
+    def api_log_connect_timeout(self) -> float:
+        """Get connect timeout for API error logging."""
+        return float(self.get('api.log_connect_timeout', 2.0) or 2.0)
+
+    @property
+    def api_log_read_timeout(self) -> float:
+        """Get read timeout for API error logging."""
+        return float(self.get('api.log_read_timeout', 4.0) or 4.0)
+    
     @property
     def temp_dir(self) -> str:
         """Get temporary directory path."""
@@ -345,6 +403,11 @@ class Config:
         """Whether to optimize PNG files."""
         return self.get('upload.optimize_png', True)
 
+    @property
+    def upload_jpeg_optimize(self) -> bool:
+        """Whether JPEG saves run Pillow's extra Huffman-optimization pass."""
+        return bool(self.get('upload.jpeg_optimize', False))
+
     @property
     def upload_zip_bundle_size(self) -> int:
         """Get max files per ZIP bundle (0 = unlimited)."""
@@ -360,6 +423,41 @@ class Config:
         """Get ZIP compression level (1-9, 9 = best)."""
         return self.get('upload.zip_compression_level', 6)
 
+    @property
+    def upload_compression_algo(self) -> str:
+        """ZIP entry codec (deflate, zstd-fast, zstd-balanced, zstd-max)."""
+        return self.get('upload.compression_algo', 'deflate')
+
+    @property
+    def upload_zip_streaming(self) -> bool:
+        """Whether to stream ZIP bundles during upload instead of writing a temp file."""
+        return bool(self.get('upload.zip_streaming', False))
+
+    @property
+    def upload_append_batch(self) -> bool:
+        """Whether individual uploads append several pages per request."""
+        return bool(self.get('upload.append_batch', False))
+
+    @property
+    def upload_append_flush_pages(self) -> int:
+        """Pages buffered per append request while scanning."""
+        return max(1, int(self.get('upload.append_flush_pages', 1)))
+
+    @property
+    def upload_append_flush_interval(self) -> float:
+        """Seconds before buffered scan-time pages are appended anyway."""
+        return float(self.get('upload.append_flush_interval', 2.0))
+
+    @property
+    def upload_use_sendfile(self) -> bool:
+        """Whether page uploads to plain HTTP endpoints use sendfile(2)."""
+        return bool(self.get('upload.use_sendfile', False))
+
+    @property
+    def upload_parallel_prepare(self) -> bool:
+        """Whether to prepare ZIP pages in parallel worker processes."""
+        return bool(self.get('upload.parallel_prepare', False))
+
     @property
     def upload_auto_jpeg_threshold(self) -> int:
         """Get auto-JPEG conversion threshold (0 = disabled)."""
@@ -373,4 +471,9 @@ class Config:
     @property
     def upload_max_image_dimension(self) -> int:
         """Get max image dimension (0 = unlimited)."""
-        return self.get('upload.max_image_dimension', 0)
\ No newline at end of file
+        return self.get('upload.max_image_dimension', 0)
+
+    @property
+    def upload_fast_resize(self) -> bool:
+        """Whether large downscales use faster area/reducing_gap resampling."""
+        return bool(self.get('upload.fast_resize', True))
\ No newline at end of file
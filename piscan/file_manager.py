@@ -1,8 +1,10 @@
 """File management for scanned documents."""
 
+import glob
 import os
 import shutil
 import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import List, Optional
 # Simple logger fallback - silent unless debug enabled
@@ -39,6 +41,14 @@ class FileManager:
         os.makedirs(self.config.temp_dir, exist_ok=True)
         os.makedirs(self.config.failed_dir, exist_ok=True)
     
+    def run_retention(self) -> None:
+        """Remove temp and failed scan jobs past their retention period."""
+        try:
+            self.cleanup_old_temp_jobs(self.config.temp_retention_hours)
+            self.cleanup_old_failed_jobs(self.config.failed_retention_days)
+        except Exception as e:
+            self.logger.warning(f"Retention cleanup skipped: {e}")
+
     def create_scan_directory(self) -> str:
         """Create a timestamped directory for a new scan job.
         
@@ -47,13 +57,9 @@ class FileManager:
         Returns:
             Path to the created directory
         """
-        try:
-            self.cleanup_old_temp_jobs(self.config.temp_retention_hours)
-            self.cleanup_old_failed_jobs(self.config.failed_retention_days)
-        except Exception as e:
-            self.logger.warning(f"Retention cleanup skipped: {e}")
+        self.run_retention()
 
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+        timestamp = time.strftime("%Y-%m-%d-%H%M%S", time.localtime())
         scan_dir = os.path.join(self.config.temp_dir, timestamp)
         os.makedirs(scan_dir, exist_ok=True)
         
@@ -82,9 +88,11 @@ class FileManager:
 
             # Only touch directories that look like our scan jobs
             # - FileManager style: YYYY-MM-DD-HHMMSS
+            # - scan.py style: YYYY-MM-DD-HHMMSS-<random> (left behind if killed)
             # - scanbd style: scan-YYYY-MM-DD-HHMMSS
             is_job_dir = (
-                len(item) == 15 and item[4] == '-' and item[7] == '-' and item[10] == '-'
+                (len(item) == 15 or (len(item) > 16 and item[15] == '-'))
+                and item[4] == '-' and item[7] == '-' and item[10] == '-'
             ) or (
                 item.startswith('scan-') and len(item) == 20 and item[9] == '-' and item[12] == '-' and item[15] == '-'
             )
@@ -110,7 +118,7 @@ class FileManager:
             Document ID in format YYYY-MM-DD-HH:MM-XXXXX
         """
         if timestamp is None:
-            timestamp = datetime.now().strftime("%Y-%m-%d-%H:%M")
+            timestamp = time.strftime("%Y-%m-%d-%H:%M", time.localtime())
         
         # Generate 5-digit hash from timestamp and random data
         hash_input = timestamp + str(os.urandom(4).hex())
@@ -177,8 +185,6 @@ class FileManager:
         Returns:
             List of file paths
         """
-        import glob
-        
         if not os.path.exists(scan_dir):
             return []
         
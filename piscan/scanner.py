@@ -1,13 +1,37 @@
 """Scanner interface using SANE scanimage."""
 
+import ctypes
+import select
+import struct
 import subprocess
 import os
 import re
-from typing import List, Optional, Tuple
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from PIL import Image
 
+try:
+    import sane
+except ImportError:
+    sane = None
+
 from .logger import Logger as PiScanLogger
 
+# scanimage output hinting that the device is reachable but busy or misconfigured
+_CONFIG_ERROR_HINTS = ("invalid argument", "busy", "net.conf")
+# "device `<name>' is a <description>" lines of scanimage -L
+_DEVICE_LINE_RE = re.compile(r"device `([^']+)' is a (.+)")
+# Source option line of scanimage -A: --source Flatbed|ADF Front|ADF Duplex [Flatbed]
+_SOURCE_OPTION_RE = re.compile(r'--source\s+([^\[]+)')
+
+# Scan area (width, height) in mm per paper_size setting
+_PAPER_SIZES_MM = {
+    "A4": (210, 297),
+    "LETTER": (215.9, 279.4),
+    "LEGAL": (215.9, 355.6),
+}
+
 
 def _format_size(size_bytes: int) -> str:
     """Format byte size to human-readable string."""
@@ -19,20 +43,221 @@ def _format_size(size_bytes: int) -> str:
     return f"{size:.1f} TB"
 
 
+class _InotifyWatch:
+    """Minimal Linux inotify watch reporting files completed in one directory.
+
+    A file is reported once it has been closed after writing, or renamed into
+    the directory (scanimage writes pages to a .part file and renames it).
+    """
+
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_TO = 0x00000080
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+    _EVENT = struct.Struct('iIII')  # wd, mask, cookie, len
+
+    def __init__(self, fd: int):
+        self._fd = fd
+
+    @classmethod
+    def open(cls, path: str) -> Optional['_InotifyWatch']:
+        """Start watching path, or return None if inotify is unavailable."""
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            fd = libc.inotify_init1(cls._IN_NONBLOCK | cls._IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(path), cls._IN_CLOSE_WRITE | cls._IN_MOVED_TO) < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def read_names(self) -> List[str]:
+        """Return names of files completed since the last call (non-blocking)."""
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        names: List[str] = []
+        offset = 0
+        while offset + self._EVENT.size <= len(data):
+            _, _, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if name:
+                names.append(os.fsdecode(name))
+        return names
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+_sane_initialized = False
+_sane_init_lock = threading.Lock()
+
+
+def sane_init() -> None:
+    """Initialize python-sane once per process.
+
+    Raises:
+        Exception: python-sane errors, if initialization fails
+    """
+    global _sane_initialized
+    with _sane_init_lock:
+        if not _sane_initialized:
+            sane.init()
+            _sane_initialized = True
+
+
+class _ScannerDaemon:
+    """SANE device handle kept open across scans via python-sane.
+
+    Opening a device runs the backend's probe and firmware handshake, which
+    takes seconds on USB scanners. The handle is opened on the first scan
+    and reused by later scans of the same device in this process.
+    """
+
+    _shared: Optional['_ScannerDaemon'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dev: Any = None
+        self._device: Optional[str] = None
+
+    @classmethod
+    def shared(cls) -> '_ScannerDaemon':
+        """Return the process-wide instance."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _open(self, device: str) -> Any:
+        """Return an open handle for device, reopening if it changed."""
+        if self._dev is not None and self._device == device:
+            return self._dev
+        self._close()
+        sane_init()
+        self._dev = sane.open(device)
+        self._device = device
+        return self._dev
+
+    def _close(self) -> None:
+        if self._dev is not None:
+            try:
+                self._dev.close()
+            except Exception:
+                pass
+        self._dev = None
+        self._device = None
+
+    def handle(self, device: str) -> Any:
+        """Return the open handle for device, opening it if needed."""
+        with self._lock:
+            return self._open(device)
+
+    def close(self) -> None:
+        """Release the device handle."""
+        with self._lock:
+            self._close()
+
+    def scan_to(self, device: str, output_dir: str, format_ext: str, options: Dict[str, Any],
+                max_pages: Optional[int] = None,
+                page_ready: Optional[Callable[[str], None]] = None) -> List[str]:
+        """Scan all pages in the feeder to output_dir.
+
+        Args:
+            device: SANE device name
+            output_dir: Directory for page_NNN.<format_ext> files
+            format_ext: File extension, which also selects the image format
+            options: SANE options by python-sane name; unsupported ones are skipped
+            max_pages: Optional maximum number of pages to scan
+            page_ready: Optional function called with each page path once saved
+
+        Returns:
+            List of scanned file paths
+
+        Raises:
+            Exception: SANE errors; the handle is closed so the next scan reopens it
+        """
+        paths: List[str] = []
+        with self._lock:
+            dev = self._open(device)
+            try:
+                for name, value in options.items():
+                    if name in dev.opt:
+                        setattr(dev, name, value)
+
+                try:
+                    for image in dev.multi_scan():
+                        path = os.path.join(output_dir, f"page_{len(paths) + 1:03d}.{format_ext}")
+                        image.save(path)
+                        paths.append(path)
+                        if page_ready:
+                            page_ready(path)
+                        if max_pages and len(paths) >= max_pages:
+                            break
+                finally:
+                    dev.cancel()
+            except Exception:
+                self._close()
+                raise
+        return paths
+
+
+def open_shared_handle(device: str) -> Any:
+    """Return the process-wide python-sane handle for device.
+
+    Scanners using the sane backend scan through this same handle, so a
+    caller that reads options from it (e.g. to poll the scanner buttons)
+    doesn't have to release the device before a scan.
+
+    Args:
+        device: SANE device name
+
+    Returns:
+        Open python-sane device
+    """
+    return _ScannerDaemon.shared().handle(device)
+
+
+def close_shared_handle() -> None:
+    """Release the handle returned by open_shared_handle()."""
+    _ScannerDaemon.shared().close()
+
+
 class Scanner:
     """Scanner interface using SANE scanimage utility."""
     
-    def __init__(self, config, uploader=None):
+    def __init__(self, config, uploader=None, device: Optional[str] = None):
         """Initialize scanner interface.
         
         Args:
             config: Configuration object
             uploader: Optional uploader instance for error logging
+            device: Optional device name, used instead of scanner.device
+                    and auto-detection
         """
         self.config = config
         self.logger = PiScanLogger()
-        self.device = self._get_device()
+        self.device = device or self._get_device()
         self.uploader = uploader
+        self._daemon: Optional[_ScannerDaemon] = None
+        if config.scanner_backend == 'sane':
+            if sane is not None:
+                self._daemon = _ScannerDaemon.shared()
+            else:
+                self.logger.warning("python-sane not available - using scanimage backend")
     
     def _apply_color_correction(self, file_path: str, source: Optional[str] = None) -> None:
         """Apply color correction and optimization to scanned image.
@@ -45,6 +270,7 @@ class Scanner:
         optimize_png = self.config.upload_optimize_png
         image_quality = self.config.upload_image_quality
         mirror_simplex = self.config.scanner_mirror_simplex
+        recompress = self.config.scanner_recompress and file_path.lower().endswith(('.jpg', '.jpeg'))
 
         # Check if mirror logic is needed
         should_mirror = False
@@ -52,7 +278,8 @@ class Scanner:
             should_mirror = True
 
         # Skip if no correction needed and no optimization
-        if (correction_mode == "none" or not correction_mode) and not optimize_png and not should_mirror:
+        if (correction_mode == "none" or not correction_mode) and not optimize_png and not should_mirror \
+                and not recompress:
             return
 
         try:
@@ -126,16 +353,17 @@ class Scanner:
                         img = Image.merge('RGB', corrected_channels)
 
             # Save with optimization if needed
-            if needs_save or optimize_png:
+            if needs_save or optimize_png or recompress:
                 file_ext = file_path.lower().split('.')[-1]
                 save_kwargs = {}
 
                 if file_ext in ['jpg', 'jpeg']:
-                    save_kwargs['quality'] = image_quality
+                    quality = self.config.scanner_recompress_quality if recompress else image_quality
+                    save_kwargs['quality'] = quality
                     save_kwargs['optimize'] = True
                     save_kwargs['progressive'] = True
                     save_kwargs['subsampling'] = 2
-                    self.logger.info(f"JPEG save settings: quality={image_quality}, optimize=True, progressive=True, subsampling=2")
+                    self.logger.info(f"JPEG save settings: quality={quality}, optimize=True, progressive=True, subsampling=2")
                 elif file_ext == 'png' and optimize_png:
                     save_kwargs['optimize'] = True
                     self.logger.info(f"PNG save settings: optimize=True")
@@ -177,7 +405,7 @@ class Scanner:
             # List all available scanners
             result = subprocess.run([
                 'scanimage', '-L'
-            ], capture_output=True, text=True, timeout=10)
+            ], capture_output=True, text=True, timeout=10, close_fds=False)
 
             if result.returncode != 0:
                 self.logger.warning(f"Failed to list scanners: {result.stderr}")
@@ -192,7 +420,7 @@ class Scanner:
 
                 # Extract device string and description
                 # Format: device `device_string' is a MANUFACTURER MODEL scanner
-                match = re.search(r"device `([^']+)' is a (.+)", line)
+                match = _DEVICE_LINE_RE.search(line)
                 if match:
                     device_string = match.group(1)
                     description = match.group(2)
@@ -252,7 +480,7 @@ class Scanner:
                 'scanimage',
                 '-d', self.device,
                 '--test'
-            ], capture_output=True, text=True, timeout=30)
+            ], capture_output=True, text=True, timeout=30, close_fds=False)
 
             if result.returncode == 0:
                 self.logger.info("Scanner test successful")
@@ -260,7 +488,7 @@ class Scanner:
             else:
                 # Check if this is a configuration issue rather than device issue
                 error_output = (result.stderr + result.stdout).lower()
-                if "invalid argument" in error_output or "busy" in error_output or "net.conf" in error_output:
+                if any(hint in error_output for hint in _CONFIG_ERROR_HINTS):
                     self.logger.warning(f"Scanner test failed due to configuration/access issue: {result.stderr}")
                     self.logger.warning("Scanner appears to be connected but may be managed by scanbd or have configuration issues")
                     # Still return True since device is detectable - the actual scan may work
@@ -273,7 +501,8 @@ class Scanner:
             return False
     
     def scan_pages(self, output_dir: str, source: Optional[str] = None, 
-                   page_callback=None, max_pages: Optional[int] = None) -> List[str]:
+                   page_callback=None, max_pages: Optional[int] = None,
+                   format_type: Optional[str] = None) -> List[str]:
         """Scan pages to output directory.
         
         Args:
@@ -282,6 +511,7 @@ class Scanner:
             page_callback: Optional callback function called when each page is ready.
                           Called with (page_number, file_path) as arguments.
             max_pages: Optional maximum number of pages to scan
+            format_type: Output format (jpeg, png, tiff); defaults to scanner.format
             
         Returns:
             List of scanned file paths
@@ -290,13 +520,17 @@ class Scanner:
             ScannerError: If scanning fails
         """
         source = source or self.config.scanner_source
+        format_type = format_type or self.config.scanner_format
         
         # Determine actual source
         actual_source = self._determine_source(source)
         
         # Build scanimage command
         # Note: scanimage uses 'jpg' extension for jpeg format
-        format_ext = 'jpg' if self.config.scanner_format == 'jpeg' else self.config.scanner_format
+        format_ext = 'jpg' if format_type == 'jpeg' else format_type
+
+        if self._daemon is not None:
+            return self._scan_pages_sane(output_dir, actual_source, format_ext, page_callback, max_pages)
         
         cmd = [
             'scanimage',
@@ -304,25 +538,19 @@ class Scanner:
             '--resolution', str(self.config.scanner_resolution),
             '--mode', self.config.scanner_mode,
             '--source', actual_source,
-            f'--format={self.config.scanner_format}',
+            f'--format={format_type}',
         ]
 
         if max_pages:
             cmd.append(f'--batch-count={max_pages}')
 
         # Apply paper size / geometry
-        paper_size = self.config.scanner_paper_size
-        if paper_size:
-            ps = paper_size.upper()
-            if ps == "A4":
-                # Standard A4 height (297mm)
-                # Also set page-width/height explicitly for drivers that require it.
-                cmd.extend(['--page-width', '210', '--page-height', '297', '-x', '210', '-y', '297'])
-            elif ps == "LETTER":
-                cmd.extend(['--page-width', '215.9', '--page-height', '279.4', '-x', '215.9', '-y', '279.4'])
-            elif ps == "LEGAL":
-                cmd.extend(['--page-width', '215.9', '--page-height', '355.6', '-x', '215.9', '-y', '355.6'])
-            # "Max" or "Auto" usually implies default driver behavior (no args)
+        # Also set page-width/height explicitly for drivers that require it.
+        # "Max" or "Auto" usually implies default driver behavior (no args)
+        paper = _PAPER_SIZES_MM.get((self.config.scanner_paper_size or '').upper())
+        if paper:
+            width, height = str(paper[0]), str(paper[1])
+            cmd.extend(['--page-width', width, '--page-height', height, '-x', width, '-y', height])
 
         # Disable swcrop to prevent auto-cropping footer
         cmd.append('--swcrop=no')
@@ -337,43 +565,46 @@ class Scanner:
             # Always monitor output_dir while scanimage runs.
             # This allows per-page post-processing (color correction/optimization)
             # even when callers want to upload at the end (ZIP mode).
-            import threading
-            import time
-
-            scan_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            # Watch before starting scanimage so no page can slip past
+            watcher = _InotifyWatch.open(output_dir)
+            try:
+                scan_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, close_fds=False)
+            except Exception:
+                if watcher is not None:
+                    watcher.close()
+                raise
             scanned_files: List[str] = []
             seen_files = set()
             pattern = re.compile(f"page_.*\\.{re.escape(format_ext)}$")
 
             def wait_for_file_complete(path: str, timeout_s: float = 10.0) -> None:
-                """Wait until the scanned file is fully written."""
-                start = time.time()
+                """Wait until the scanned file is fully written.
+
+                The size must be non-zero and unchanged across two stats
+                20ms apart; scanimage renames finished pages into place, so
+                this normally passes on the first comparison.
+                """
+                deadline = time.monotonic() + timeout_s
                 last_size = -1
-                stable_rounds = 0
 
-                while time.time() - start < timeout_s:
+                while time.monotonic() < deadline:
                     try:
-                        size = os.path.getsize(path)
+                        size = os.stat(path).st_size
                     except OSError:
-                        time.sleep(0.1)
-                        continue
+                        size = -1
 
                     if size > 0 and size == last_size:
-                        stable_rounds += 1
-                        if stable_rounds >= 2:
-                            return
-                    else:
-                        stable_rounds = 0
-                        last_size = size
+                        return
+                    last_size = size
+                    time.sleep(0.02)
 
-                    time.sleep(0.1)
-
-            def handle_new_file(filepath: str) -> None:
+            def handle_new_file(filepath: str, complete: bool = False) -> None:
                 if filepath in seen_files:
                     return
 
                 seen_files.add(filepath)
-                wait_for_file_complete(filepath)
+                if not complete:
+                    wait_for_file_complete(filepath)
 
                 # Apply per-page post-processing right away
                 self._apply_color_correction(filepath, source=actual_source)
@@ -388,14 +619,39 @@ class Scanner:
                     except Exception as e:
                         self.logger.error(f"Callback error: {e}")
 
+            def watch_pages(watch: _InotifyWatch) -> None:
+                """Handle page files as soon as inotify reports them complete."""
+                try:
+                    while scan_process.poll() is None:
+                        # Short timeout so the loop notices scanimage exiting
+                        ready, _, _ = select.select([watch], [], [], 0.3)
+                        if not ready:
+                            continue
+                        for filename in watch.read_names():
+                            if pattern.match(filename):
+                                handle_new_file(os.path.join(output_dir, filename), complete=True)
+                except Exception as e:
+                    self.logger.warning(f"Error monitoring pages: {e}")
+                finally:
+                    watch.close()
+
+            def page_paths() -> List[str]:
+                """Page files currently in output_dir, in page order."""
+                # Only the matching entries are collected and sorted
+                with os.scandir(output_dir) as entries:
+                    return sorted(entry.path for entry in entries if pattern.match(entry.name))
+
             def monitor_pages() -> None:
                 """Monitor directory for new page files."""
+                if watcher is not None:
+                    watch_pages(watcher)
+                    return
+
                 while scan_process.poll() is None:
                     time.sleep(0.3)  # Check every 300ms
                     try:
-                        for filename in sorted(os.listdir(output_dir)):
-                            if pattern.match(filename):
-                                handle_new_file(os.path.join(output_dir, filename))
+                        for page_path in page_paths():
+                            handle_new_file(page_path)
                     except Exception as e:
                         self.logger.warning(f"Error monitoring pages: {e}")
 
@@ -409,19 +665,16 @@ class Scanner:
             # Final sweep: scanimage can exit quickly and still leave page files.
             # Make sure we don't miss the last page(s) before evaluating errors.
             try:
-                for filename in sorted(os.listdir(output_dir)):
-                    if pattern.match(filename):
-                        handle_new_file(os.path.join(output_dir, filename))
+                for page_path in page_paths():
+                    handle_new_file(page_path)
             except Exception as e:
                 self.logger.warning(f"Error during final page sweep: {e}")
 
             returncode = scan_process.returncode
             output_text = (stdout + stderr).lower()
 
-            feeder_out = (
-                "document feeder out of documents" in output_text
-                or "feeder out" in output_text
-            )
+            # Also matches "document feeder out of documents"
+            feeder_out = "feeder out" in output_text
 
             # scanimage commonly exits non-zero when ADF is empty at the end.
             # Treat this as success *if* we already scanned at least one page.
@@ -519,6 +772,76 @@ class Scanner:
                     self.logger.warning(f"Failed to log error to API: {log_err}")
             raise ScannerError(error_msg)
     
+    def close(self) -> None:
+        """Release the persistent SANE handle, if one is in use."""
+        if self._daemon is not None:
+            self._daemon.close()
+
+    def _scan_pages_sane(self, output_dir: str, actual_source: str, format_ext: str,
+                         page_callback=None, max_pages: Optional[int] = None) -> List[str]:
+        """Scan pages through the persistent python-sane handle.
+
+        Args:
+            output_dir: Directory to save scanned pages
+            actual_source: Scanner-specific source name
+            format_ext: Page file extension
+            page_callback: Optional callback called with (page_number, file_path)
+            max_pages: Optional maximum number of pages to scan
+
+        Returns:
+            List of scanned file paths
+
+        Raises:
+            ScannerError: If scanning fails or no page was scanned
+        """
+        # python-sane exposes scanimage's --opt-name options as opt_name
+        options: Dict[str, Any] = {
+            'resolution': int(self.config.scanner_resolution),
+            'mode': self.config.scanner_mode,
+            'source': actual_source,
+            'swcrop': 0,
+        }
+        paper = _PAPER_SIZES_MM.get((self.config.scanner_paper_size or '').upper())
+        if paper:
+            options.update(page_width=paper[0], page_height=paper[1], tl_x=0, tl_y=0, br_x=paper[0], br_y=paper[1])
+
+        scanned_files: List[str] = []
+
+        def page_ready(filepath: str) -> None:
+            self._apply_color_correction(filepath, source=actual_source)
+            scanned_files.append(filepath)
+            page_num = len(scanned_files)
+            self.logger.debug(f"Page {page_num} ready: {filepath}")
+            if page_callback:
+                try:
+                    page_callback(page_num, filepath)
+                except Exception as e:
+                    self.logger.error(f"Callback error: {e}")
+
+        self.logger.info(f"Starting scan with source: {actual_source} (persistent SANE handle)")
+        try:
+            self._daemon.scan_to(self.device, output_dir, format_ext, options, max_pages, page_ready)
+        except Exception as e:
+            if not scanned_files:
+                error_msg = f"Scan error: {e}"
+                self.logger.error(error_msg)
+                if self.uploader:
+                    try:
+                        self.uploader.log_error(
+                            error_msg,
+                            level="error",
+                            details={"source": actual_source, "device": self.device, "exception": str(e)}
+                        )
+                    except Exception as log_err:
+                        self.logger.warning(f"Failed to log error to API: {log_err}")
+                raise ScannerError(error_msg)
+            self.logger.warning(f"Scan stopped after {len(scanned_files)} page(s): {e}")
+
+        self.logger.info(f"Scanned {len(scanned_files)} pages")
+        if not scanned_files:
+            raise ScannerError("No pages were scanned. Please load paper into the document feeder and try again.")
+        return scanned_files
+
     def _map_source_name(self, source: str) -> str:
         """Map generic source name to scanner-specific name.
         
@@ -540,11 +863,11 @@ class Scanner:
         try:
             result = subprocess.run([
                 'scanimage', '-d', self.device, '-A'
-            ], capture_output=True, text=True, timeout=10)
+            ], capture_output=True, text=True, timeout=10, close_fds=False)
             
             if result.returncode == 0:
                 # Parse source line: --source Flatbed|ADF Front|ADF Duplex [Flatbed]
-                source_match = re.search(r'--source\s+([^\[]+)', result.stdout)
+                source_match = _SOURCE_OPTION_RE.search(result.stdout)
                 if source_match:
                     available_sources = [s.strip() for s in source_match.group(1).split('|')]
                     self.logger.debug(f"Available sources: {available_sources}")
@@ -598,7 +921,7 @@ class Scanner:
             # Check scanner status for paper in ADF
             result = subprocess.run([
                 'scanimage', '-d', self.device, '-A'
-            ], capture_output=True, text=True, timeout=10)
+            ], capture_output=True, text=True, timeout=10, close_fds=False)
             
             if result.returncode == 0:
                 # Look for ADF status in options
@@ -631,7 +954,7 @@ class Scanner:
             # Get scanner options
             result = subprocess.run([
                 'scanimage', '-d', self.device, '-A'
-            ], capture_output=True, text=True, timeout=10)
+            ], capture_output=True, text=True, timeout=10, close_fds=False)
             
             if result.returncode == 0:
                 info['status'] = 'available'
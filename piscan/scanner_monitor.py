@@ -43,7 +43,7 @@ class ScannerHealthMonitor:
             # Try to list scanners - if scanner is available, it should appear
             result = subprocess.run([
                 'scanimage', '-L'
-            ], capture_output=True, text=True, timeout=10)
+            ], capture_output=True, text=True, timeout=10, close_fds=False)
 
             if result.returncode == 0:
                 output = result.stdout.lower()
@@ -66,7 +66,7 @@ class ScannerHealthMonitor:
         try:
             result = subprocess.run([
                 'systemctl', 'is-active', 'scanbd'
-            ], capture_output=True, text=True, timeout=5)
+            ], capture_output=True, text=True, timeout=5, close_fds=False)
 
             return result.returncode == 0 and result.stdout.strip() == 'active'
 
@@ -84,7 +84,7 @@ class ScannerHealthMonitor:
 
             result = subprocess.run([
                 'systemctl', 'restart', 'scanbd'
-            ], capture_output=True, text=True, timeout=30)
+            ], capture_output=True, text=True, timeout=30, close_fds=False)
 
             if result.returncode == 0:
                 self.logger.info("scanbd restarted successfully")
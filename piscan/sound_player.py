@@ -30,7 +30,7 @@ class SoundPlayer:
 
     def _has_cmd(self, cmd: str) -> bool:
         try:
-            result = subprocess.run(['which', cmd], capture_output=True, text=True, timeout=2)
+            result = subprocess.run(['which', cmd], capture_output=True, text=True, timeout=2, close_fds=False)
             return result.returncode == 0
         except Exception:
             return False
@@ -57,7 +57,8 @@ class SoundPlayer:
                     ['which', player],
                     capture_output=True,
                     text=True,
-                    timeout=5
+                    timeout=5,
+                    close_fds=False
                 )
                 if result.returncode == 0:
                     self.logger.debug(f"Found audio player: {player}")
@@ -106,14 +107,14 @@ class SoundPlayer:
                 aplay_cmd = ['aplay', '-q', '-D', device]
 
                 if self.blocking:
-                    decoder = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
-                    player = subprocess.run(aplay_cmd, stdin=decoder.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+                    decoder = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=False)
+                    player = subprocess.run(aplay_cmd, stdin=decoder.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, close_fds=False)
                     decoder.stdout.close() if decoder.stdout else None
                     decoder.wait(timeout=10)
                 else:
                     # Run in background: start a detached shell pipeline
                     pipeline = f"ffmpeg -v error -i {sound_file!r} -f wav - | aplay -q -D {device!r}"
-                    subprocess.Popen(['bash', '-lc', pipeline], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+                    subprocess.Popen(['bash', '-lc', pipeline], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True, close_fds=False)
 
                 self.logger.debug(f"Playing {sound_type} sound via ffmpeg->aplay (blocking={self.blocking})")
                 return
@@ -154,7 +155,8 @@ class SoundPlayer:
                     cmd,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
-                    check=False
+                    check=False,
+                    close_fds=False
                 )
             else:
                 # Non-blocking playback (preferred for interactive usage)
@@ -162,7 +164,8 @@ class SoundPlayer:
                     cmd,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
-                    start_new_session=True
+                    start_new_session=True,
+                    close_fds=False
                 )
             
             self.logger.debug(f"Playing {sound_type} sound: {sound_file} (blocking={self.blocking})")
@@ -3,6 +3,7 @@
 import sys
 import os
 import argparse
+import traceback
 from typing import Optional, Dict, Any
 
 # Simple logger fallback
@@ -13,7 +14,6 @@ class Logger:
     def warning(self, msg, *args): print(f"WARNING: {msg % args}")
     def exception(self, msg, *args): 
         print(f"EXCEPTION: {msg % args}")
-        import traceback
         traceback.print_exc()
 
 # Import components with fallbacks
@@ -1,23 +1,150 @@
 """HTTP uploader for scanned documents."""
 
+import contextlib
+import http.client
 import json
+import mmap
 import os
+import queue
+import struct
+import threading
+import time
+import uuid
 import zipfile
+import zlib
 import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional, cast
+from urllib.parse import urlsplit
+from typing import Iterator, List, Dict, Any, Optional, Tuple, cast
 from PIL import Image
 
 from .logger import Logger as PiScanLogger
 
 try:
     import requests as _requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Warning: requests not available. HTTP upload will be disabled.")
     _requests = None
 
 requests = cast(Any, _requests)
 
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize to JSON bytes (stdlib fallback for orjson.dumps)."""
+        return json.dumps(obj).encode('utf-8')
+
+try:
+    from isal import isal_zlib as _isal_zlib
+except ImportError:
+    _isal_zlib = None
+
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+_crc32 = _isal_zlib.crc32 if _isal_zlib is not None else zlib.crc32
+if _isal_zlib is not None:
+    # zipfile looks up its module-level crc32 on every write/read; route it
+    # through ISA-L's hardware-accelerated implementation (same results)
+    zipfile.crc32 = _isal_zlib.crc32  # type: ignore[attr-defined]
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from turbojpeg import (
+        TurboJPEG, TJPF_RGB, TJPF_GRAY, TJSAMP_420, TJSAMP_GRAY, TJFLAG_PROGRESSIVE,
+    )
+    _turbo = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # PyTurboJPEG raises RuntimeError when libturbojpeg itself is missing
+    _turbo = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Fused kernel JIT cost only pays off when a batch has at least this many pages
+_FUSED_JPEG_MIN_PAGES = 3
+
+if numba is not None and np is not None:
+    @numba.njit(parallel=True, nogil=True, cache=True, fastmath=True)
+    def _alpha_to_i420(rgba, out, y_stride, c_stride, c_height):
+        """Flatten RGBA onto white and write padded I420 (JFIF YCbCr 4:2:0) planes into out."""
+        height = rgba.shape[0]
+        width = rgba.shape[1]
+        cb_offset = y_stride * height
+        cr_offset = cb_offset + c_stride * c_height
+        for row in numba.prange(c_height):
+            for col in range((width + 1) // 2):
+                cb_sum = 0.0
+                cr_sum = 0.0
+                count = 0
+                for dy in range(2):
+                    y = 2 * row + dy
+                    if y >= height:
+                        continue
+                    for dx in range(2):
+                        x = 2 * col + dx
+                        if x >= width:
+                            continue
+                        alpha = rgba[y, x, 3] / 255.0
+                        r = rgba[y, x, 0] * alpha + 255.0 * (1.0 - alpha)
+                        g = rgba[y, x, 1] * alpha + 255.0 * (1.0 - alpha)
+                        b = rgba[y, x, 2] * alpha + 255.0 * (1.0 - alpha)
+                        luma = 0.299 * r + 0.587 * g + 0.114 * b + 0.5
+                        out[y * y_stride + x] = min(255.0, luma)
+                        cb_sum += 128.0 - 0.168736 * r - 0.331264 * g + 0.5 * b
+                        cr_sum += 128.0 + 0.5 * r - 0.418688 * g - 0.081312 * b
+                        count += 1
+                out[cb_offset + row * c_stride + col] = min(255.0, max(0.0, cb_sum / count + 0.5))
+                out[cr_offset + row * c_stride + col] = min(255.0, max(0.0, cr_sum / count + 0.5))
+else:
+    _alpha_to_i420 = None
+
+# Read size for streaming page files into the ZIP writer
+_ZIP_CHUNK_SIZE = 1024 * 1024
+# Streamed ZIP output is coalesced into HTTP chunks of at least this size
+_STREAM_SEND_SIZE = 256 * 1024
+# Archives beyond these limits need ZIP64, which only zipfile writes
+_ZIP32_MAX_BYTES = 0x7FFFFFFF
+_ZIP32_MAX_ENTRIES = 0xFFFF
+# Already-compressed formats gain nothing from DEFLATE; store them as-is
+_STORED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.pdf', '.zip'})
+# APPNOTE method id for Zstandard-compressed entries
+_ZIP_ZSTANDARD = 93
+# upload.compression_algo values backed by Zstandard, with their levels
+_ZSTD_LEVELS = {'zstd-fast': 3, 'zstd-balanced': 15, 'zstd-max': 22}
+
+_MIME_BY_EXT = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.tif': 'image/tiff',
+    '.tiff': 'image/tiff',
+    '.pdf': 'application/pdf',
+    '.zip': 'application/zip',
+}
+
 
 def _format_size(size_bytes: int) -> str:
     """Format byte size to human-readable string."""
@@ -29,8 +156,151 @@ def _format_size(size_bytes: int) -> str:
     return f"{size:.1f} TB"
 
 
+def _dos_timestamp(mtime: float) -> Tuple[int, int]:
+    """Convert a POSIX mtime to ZIP (MS-DOS) time and date fields."""
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (1 << 5) | 1
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+
+# JPEG start-of-frame markers (C4 = DHT, C8 = JPG, CC = DAC are not frames)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _image_dimensions_fast(path: str) -> Optional[Tuple[int, int]]:
+    """Read (width, height) from a JPEG or PNG header without Pillow.
+
+    Returns:
+        Image size, or None if the format is not recognised or the header
+        cannot be parsed
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(24)
+            if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+                width, height = struct.unpack('>II', head[16:24])
+                return width, height
+            if head[:2] != b'\xff\xd8':
+                return None
+
+            f.seek(2)
+            while True:
+                byte = f.read(1)
+                while byte and byte != b'\xff':
+                    byte = f.read(1)
+                while byte == b'\xff':
+                    byte = f.read(1)
+                if not byte:
+                    return None
+                marker = byte[0]
+                if marker == 0xD9 or marker == 0xDA:
+                    return None
+                if 0xD0 <= marker <= 0xD7 or marker == 0x01:
+                    continue
+                segment = f.read(2)
+                if len(segment) < 2:
+                    return None
+                length = struct.unpack('>H', segment)[0]
+                if marker in _JPEG_SOF_MARKERS:
+                    frame = f.read(5)
+                    if len(frame) < 5:
+                        return None
+                    height, width = struct.unpack('>HH', frame[1:5])
+                    return width, height
+                f.seek(length - 2, os.SEEK_CUR)
+    except (OSError, struct.error):
+        return None
+
+
+def _zip_method(path: str) -> int:
+    """Pick the ZIP compression method for a file based on its extension."""
+    if os.path.splitext(path)[1].lower() in _STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+class _RawResponse:
+    """Minimal response object for requests sent without the requests library."""
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class _MappedFile:
+    """Read-only memory map of a page file, readable like an open file.
+
+    Exposes the remaining byte count as ``len`` (not ``__len__``) so
+    requests and requests_toolbelt size the part from the current position.
+    """
+
+    __slots__ = ('_map',)
+
+    def __init__(self, mapping: mmap.mmap):
+        self._map = mapping
+
+    @property
+    def len(self) -> int:
+        return self._map.size() - self._map.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._map.read(size)
+
+    def close(self) -> None:
+        self._map.close()
+
+
+def _release_page_cache(fd: int) -> None:
+    """Drop a fully uploaded file's pages from the page cache.
+
+    Page files are sent once and then deleted, so keeping them cached only
+    pushes out data the next scan could use. Dirty pages are left alone by
+    the kernel.
+    """
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except (AttributeError, OSError):
+        pass
+
+
+# Per-process uploader used by the parallel page preparation pool
+_worker_uploader: Optional['Uploader'] = None
+
+
+def _init_prepare_worker(config) -> None:
+    """Process pool initializer: build the uploader used by page workers."""
+    global _worker_uploader
+    _worker_uploader = Uploader(config)
+
+
+def _prepare_file_for_zip_worker(args: Tuple[str, int, int, int]) -> str:
+    """Prepare one page in a pool process (see Uploader._prepare_file_for_zip)."""
+    file_path, total_pages, auto_jpeg_threshold, auto_jpeg_page_size_bytes = args
+    return cast(Uploader, _worker_uploader)._prepare_file_for_zip(
+        file_path,
+        total_pages=total_pages,
+        auto_jpeg_threshold=auto_jpeg_threshold,
+        auto_jpeg_page_size_bytes=auto_jpeg_page_size_bytes,
+    )
+
+
 class Uploader:
     """Handles uploading scanned documents to remote API."""
+
+    __slots__ = ('config', 'logger', 'enabled', '_stat_cache', '_stat_lock', '_upload_impl',
+                 '_stream_zip', '_session', '_zstd_level', '_pending', '_pending_doc_id',
+                 '_pending_cond', '_flush_timer', '_flushing', '_api_base', '_auth_headers',
+                 '_timeout', '_log_timeout', '_use_sendfile')
     
     def __init__(self, config):
         """Initialize uploader.
@@ -41,27 +311,300 @@ class Uploader:
         self.config = config
         self.logger = PiScanLogger()
         self.enabled = requests is not None
+        # stat() results per path, valid for the duration of one upload. The
+        # lock covers uploads running next to timed flushes and prefetch or
+        # bundle worker threads.
+        self._stat_cache: Dict[str, os.stat_result] = {}
+        self._stat_lock = threading.Lock()
+        # The compression mode is fixed per uploader, so pick the upload
+        # strategy once instead of branching on every document.
+        if config.upload_compression == "zip":
+            self._upload_impl = self._upload_document_zip
+        else:
+            self._upload_impl = self._upload_incremental
+        # Zstandard level for ZIP entries, or None for DEFLATE
+        self._zstd_level: Optional[int] = None
+        algo = config.upload_compression_algo
+        if algo in _ZSTD_LEVELS:
+            if _zstd is not None:
+                self._zstd_level = _ZSTD_LEVELS[algo]
+            else:
+                self.logger.warning("zstandard library not available - ZIP bundles will use DEFLATE")
+        elif algo != 'deflate':
+            self.logger.warning(f"Unknown upload.compression_algo '{algo}' - ZIP bundles will use DEFLATE")
+        # Endpoint, auth and timeout settings are fixed for the uploader's lifetime
+        self._api_base = f"{config.api_url}/{config.api_workspace}/api"
+        self._auth_headers: Dict[str, str] = (
+            {'Authorization': f'Bearer {config.api_token}'} if config.api_token else {}
+        )
+        self._timeout = config.api_timeout
+        self._log_timeout = (config.api_log_connect_timeout, config.api_log_read_timeout)
+        # sendfile(2) only reaches the socket without TLS in between
+        self._use_sendfile = bool(config.upload_use_sendfile) and urlsplit(config.api_url).scheme == 'http'
+        # Streaming ZIP uploads need the built-in writer, which yields the archive in order
+        self._stream_zip = bool(config.upload_zip_streaming) and self._has_fast_zip_writer()
+        # Keep-alive session shared by all API requests of this uploader
+        self._session = self._create_session() if self.enabled else None
+        # Pages queued by append_pages_buffered(). Batches are posted outside
+        # the lock; _flushing marks one in flight so the next batch waits for
+        # it and pages reach the server in order.
+        self._pending: List[str] = []
+        self._pending_doc_id: Optional[str] = None
+        self._pending_cond = threading.Condition()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flushing = False
         
         if not self.enabled:
             self.logger.warning("requests library not available - HTTP upload disabled")
+        if config.upload_use_sendfile and not self._use_sendfile:
+            self.logger.warning("upload.use_sendfile only applies to plain http:// API URLs - ignored")
+        if config.upload_zip_streaming and not self._stream_zip:
+            self.logger.warning("isal library not available - ZIP bundles will be written to a temp file")
+
+    def _create_session(self) -> Any:
+        """Create the pooled HTTP session used for API requests.
+
+        Failed connections to the document API are retried with backoff, and
+        gateway errors are retried for idempotent requests. Requests to the log
+        endpoint are never retried (see log_error).
+
+        Returns:
+            Configured requests.Session (carrying the API token, if any)
+        """
+        session = requests.Session()
+        session.headers.update(self._auth_headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # Longest prefix wins, so the log endpoint gets its own no-retry adapter
+        session.mount(
+            f"{self._api_base}/log",
+            HTTPAdapter(max_retries=Retry(total=0, read=False)),
+        )
+        return session
 
     def _guess_mime_type(self, file_path: str) -> str:
         """Best-effort MIME type based on extension."""
-        ext = os.path.splitext(file_path.lower())[1]
-        if ext in ('.jpg', '.jpeg'):
-            return 'image/jpeg'
-        if ext == '.png':
-            return 'image/png'
-        if ext in ('.tif', '.tiff'):
-            return 'image/tiff'
-        if ext == '.pdf':
-            return 'application/pdf'
-        if ext == '.zip':
-            return 'application/zip'
-        return 'application/octet-stream'
+        return _MIME_BY_EXT.get(os.path.splitext(file_path)[1].lower(), 'application/octet-stream')
     
+    def _sends_zero_copy(self, files: List[Any]) -> bool:
+        """Whether a multipart file list is sent with _post_files_zero_copy().
+
+        Only with upload.use_sendfile on a plain http:// API; otherwise all
+        uploads go through the pooled session (retries, proxies, CA bundle).
+        """
+        return self._use_sendfile and bool(files)
+
+    def _open_upload_stream(self, stack: contextlib.ExitStack, file_path: str) -> Any:
+        """Open a page file for a multipart upload, memory-mapped where possible.
+
+        Mapping the file lets the multipart body be read straight from the
+        page cache instead of through a buffered file object. When
+        upload.use_sendfile is active, files stay regular files so they can
+        be passed to sendfile().
+
+        Args:
+            stack: Exit stack that releases the returned stream
+            file_path: File to open
+
+        Returns:
+            Mapped or regular file object positioned at the start of the file
+        """
+        if not self._use_sendfile:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                mapping = None  # empty files cannot be mapped
+            if mapping is None:
+                os.close(fd)
+            else:
+                # Callbacks run in reverse: unmap, then drop the cache and close
+                stack.callback(os.close, fd)
+                stack.callback(_release_page_cache, fd)
+                if hasattr(mapping, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    # Read ahead aggressively; each page is sent exactly once
+                    mapping.madvise(mmap.MADV_SEQUENTIAL)
+                stack.callback(mapping.close)
+                return _MappedFile(mapping)
+        file_obj = stack.enter_context(open(file_path, 'rb'))
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(file_obj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        stack.callback(_release_page_cache, file_obj.fileno())
+        return file_obj
+
+    def _post_files_zero_copy(self, url: str, files: List[Any], data: Dict[str, Any]) -> _RawResponse:
+        """POST files as multipart/form-data without copying them through Python.
+
+        The multipart headers and boundaries are written by http.client, while
+        each file body goes straight from the page cache to the socket via
+        sendfile(2). For TLS sockets the standard library falls back to a
+        plain send loop.
+
+        Args:
+            url: Target URL
+            files: Multipart file fields ('files', (filename, file_obj, content_type))
+                with regular file objects
+            data: Form fields sent ahead of the files
+
+        Returns:
+            Response with status code and body
+        """
+        field_name, (filename, file_obj, content_type) = files[0]
+        boundary, preamble, trailer = self._multipart_envelope(field_name, filename, content_type, data)
+
+        # (part header, file, size) per file; the first header is in the preamble
+        parts = [(b'', file_obj, os.fstat(file_obj.fileno()).st_size)]
+        for field_name, (filename, file_obj, content_type) in files[1:]:
+            header = b'\r\n' + self._file_part_header(boundary, field_name, filename, content_type)
+            parts.append((header, file_obj, os.fstat(file_obj.fileno()).st_size))
+        content_length = len(preamble) + len(trailer) + sum(len(h) + size for h, _, size in parts)
+
+        conn, path = self._open_connection(url)
+        try:
+            conn.putrequest('POST', path)
+            for key, value in self._auth_headers.items():
+                conn.putheader(key, value)
+            conn.putheader('Content-Type', f'multipart/form-data; boundary={boundary}')
+            conn.putheader('Content-Length', str(content_length))
+            conn.endheaders(message_body=preamble)
+
+            for header, file_obj, file_size in parts:
+                if header:
+                    conn.send(header)
+                if file_size:
+                    conn.sock.sendfile(file_obj, 0, file_size)
+            conn.send(trailer)
+
+            response = conn.getresponse()
+            return _RawResponse(response.status, response.read())
+        finally:
+            conn.close()
+
+    def _post_multipart(self, url: str, files: List[Any], data: Dict[str, Any]) -> Any:
+        """POST form fields and files as multipart/form-data.
+
+        With requests_toolbelt installed the body is generated from the open
+        file handles while sending, instead of being assembled in memory first.
+
+        Args:
+            url: Target URL
+            files: Multipart file fields ('files', (filename, file_obj, content_type))
+            data: Form fields sent ahead of the files
+
+        Returns:
+            requests.Response
+        """
+        if MultipartEncoder is None:
+            return self._session.post(url, files=files, data=data, timeout=self._timeout)
+
+        encoder = MultipartEncoder(fields=list(data.items()) + files)
+        return self._session.post(
+            url,
+            data=encoder,
+            headers={'Content-Type': encoder.content_type},
+            timeout=self._timeout,
+        )
+
+    def _post_zip_stream(self, url: str, image_files: List[str], compression_level: int,
+                         data: Dict[str, Any]) -> Tuple[Any, int]:
+        """POST page files as a ZIP archive built while it is being sent.
+
+        The archive is never written to disk: ISA-L output is handed to the
+        session as a generator, which requests sends as a chunked multipart
+        body, so compression and network transfer overlap.
+
+        Args:
+            url: Target URL
+            image_files: List of existing page file paths to archive
+            compression_level: ZIP compression level (1-9)
+            data: Form fields sent ahead of the archive
+
+        Returns:
+            Tuple of (requests.Response, number of ZIP bytes sent)
+        """
+        filename = f"{uuid.uuid4().hex}.zip"
+        boundary, preamble, trailer = self._multipart_envelope('files', filename, 'application/zip', data)
+        sent = 0
+
+        def body() -> Iterator[bytes]:
+            nonlocal sent
+            yield preamble
+            pending: List[bytes] = []
+            pending_bytes = 0
+            for chunk in self._iter_zip_fast(image_files, compression_level):
+                pending.append(chunk)
+                pending_bytes += len(chunk)
+                if pending_bytes >= _STREAM_SEND_SIZE:
+                    sent += pending_bytes
+                    yield b''.join(pending)
+                    pending.clear()
+                    pending_bytes = 0
+            sent += pending_bytes
+            yield b''.join(pending) + trailer
+
+        response = self._session.post(
+            url,
+            data=body(),
+            headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
+            timeout=self._timeout,
+        )
+        return response, sent
+
+    def _open_connection(self, url: str) -> Tuple[http.client.HTTPConnection, str]:
+        """Open an http.client connection for url, returning it with the request path."""
+        parts = urlsplit(url)
+        conn_cls = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        conn = conn_cls(parts.hostname, parts.port, timeout=self._timeout)
+        path = parts.path or '/'
+        if parts.query:
+            path += f'?{parts.query}'
+        return conn, path
+
+    def _multipart_envelope(self, field_name: str, filename: str, content_type: str,
+                            data: Dict[str, Any]) -> Tuple[str, bytes, bytes]:
+        """Build the multipart boundary, preamble and trailer around a single file part.
+
+        Args:
+            field_name: Form field name of the file part
+            filename: File name reported for the file part
+            content_type: Content type of the file part
+            data: Form fields sent ahead of the file
+
+        Returns:
+            Tuple of (boundary, preamble bytes, trailer bytes)
+        """
+        boundary = uuid.uuid4().hex
+
+        preamble = b''
+        for name, value in data.items():
+            if isinstance(value, str):
+                value = value.encode('utf-8')
+            preamble += (
+                f'--{boundary}\r\n'
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            ).encode('utf-8') + value + b'\r\n'
+        preamble += self._file_part_header(boundary, field_name, filename, content_type)
+        trailer = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+        return boundary, preamble, trailer
+
+    def _file_part_header(self, boundary: str, field_name: str, filename: str, content_type: str) -> bytes:
+        """Boundary line and headers that open a multipart file part."""
+        return (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        ).encode('utf-8')
+
     def log_error(self, message: str, level: str = "error", details: Optional[Dict[str, Any]] = None) -> None:
         """Log error to API endpoint.
+
+        Logging is best-effort: a dead log endpoint must never gate scanning, so
+        requests use short split connect/read timeouts and are not retried.
         
         Args:
             message: Error message
@@ -73,7 +616,7 @@ class Uploader:
             return
         
         try:
-            log_url = f"{self.config.api_url}/{self.config.api_workspace}/api/log"
+            log_url = f"{self._api_base}/log"
             
             payload: Dict[str, Any] = {
                 "level": level,
@@ -88,14 +631,12 @@ class Uploader:
             headers = {
                 "Content-Type": "application/json"
             }
-            if self.config.api_token:
-                headers["Authorization"] = f"Bearer {self.config.api_token}"
             
-            response = requests.post(  # type: ignore
+            response = self._session.post(
                 log_url,
-                json=payload,
+                data=_dumps(payload),
                 headers=headers,
-                timeout=10
+                timeout=self._log_timeout
             )
             
             if response.status_code in [200, 201]:
@@ -124,25 +665,45 @@ class Uploader:
         temp_zip.close()
 
         try:
-            self.logger.info(f"Creating ZIP with compression level {compression_level} for {len(image_files)} files")
-
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compression_level) as zipf:
-                for idx, image_file in enumerate(image_files, 1):
-                    if os.path.exists(image_file):
-                        arcname = os.path.basename(image_file)
-                        file_size = self._file_size_bytes(image_file)
-                        file_ext = os.path.splitext(image_file.lower())[1][1:]
-                        
-                        self.logger.info(
-                            f"Page {idx}/{len(image_files)}: {arcname} | "
-                            f"Format: {file_ext.upper()} | "
-                            f"Size: {_format_size(file_size)} | "
-                            f"ZIP compression: level {compression_level}"
-                        )
-                        
-                        zipf.write(image_file, arcname=arcname)
+            valid_files = self._validated(image_files)
+            use_fast = self._has_fast_zip_writer() and self._fits_zip32(valid_files)
+            if use_fast and self._zstd_level is not None:
+                codec = f"zstd level {self._zstd_level}"
+            else:
+                codec = 'ISA-L' if use_fast else 'zlib'
+            self.logger.info(
+                f"Creating ZIP with compression level {compression_level} for {len(image_files)} files ({codec})"
+            )
+            compressed_as = 'zstd' if codec.startswith('zstd') else 'deflated'
 
-            total_size = os.path.getsize(zip_path)
+            for idx, image_file in enumerate(valid_files, 1):
+                arcname = os.path.basename(image_file)
+                file_size = self._file_size_bytes(image_file)
+                file_ext = os.path.splitext(image_file.lower())[1][1:]
+                
+                self.logger.info(
+                    f"Page {idx}/{len(image_files)}: {arcname} | "
+                    f"Format: {file_ext.upper()} | "
+                    f"Size: {_format_size(file_size)} | "
+                    f"ZIP compression: level {compression_level}"
+                )
+                self.logger.debug(
+                    f"{arcname}: {'stored' if _zip_method(image_file) == zipfile.ZIP_STORED else compressed_as}"
+                )
+
+            if use_fast:
+                self._compress_to_zip_fast(valid_files, compression_level, zip_path)
+            else:
+                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compression_level) as zipf:
+                    for image_file in valid_files:
+                        method = _zip_method(image_file)
+                        if method == zipfile.ZIP_STORED:
+                            zipf.write(image_file, arcname=os.path.basename(image_file), compress_type=method)
+                        else:
+                            zipf.write(image_file, arcname=os.path.basename(image_file),
+                                       compress_type=method, compresslevel=compression_level)
+
+            total_size = self._file_size_bytes(zip_path)
             self.logger.info(f"Created ZIP: {zip_path} ({len(image_files)} files, {_format_size(total_size)})")
             return zip_path
 
@@ -150,6 +711,140 @@ class Uploader:
             if os.path.exists(zip_path):
                 os.remove(zip_path)
             raise UploadError(f"Failed to create ZIP archive: {e}")
+
+    def _has_fast_zip_writer(self) -> bool:
+        """Whether _iter_zip_fast has a compressor (Zstandard or ISA-L) to work with."""
+        return self._zstd_level is not None or _isal_zlib is not None
+
+    def _can_stream_zip(self, image_files: List[str]) -> bool:
+        """Whether image_files can be uploaded as a ZIP streamed during the request."""
+        return self._stream_zip and self._fits_zip32(self._validated(image_files))
+
+    def _fits_zip32(self, image_files: List[str]) -> bool:
+        """Whether files fit in a plain (non-ZIP64) archive."""
+        if len(image_files) >= _ZIP32_MAX_ENTRIES:
+            return False
+        return sum(self._file_size_bytes(path) for path in image_files) < _ZIP32_MAX_BYTES
+
+    def _compress_to_zip_fast(self, image_files: List[str], compression_level: int, zip_path: str) -> None:
+        """Write a ZIP archive with the built-in (Zstandard or ISA-L) writer.
+
+        Args:
+            image_files: List of existing image file paths
+            compression_level: ZIP compression level (1-9)
+            zip_path: Output archive path
+        """
+        with open(zip_path, 'wb') as out:
+            for chunk in self._iter_zip_fast(image_files, compression_level):
+                out.write(chunk)
+
+    def _iter_zip_fast(self, image_files: List[str], compression_level: int) -> Iterator[bytes]:
+        """Yield a ZIP archive of the given files, deflated with ISA-L.
+
+        With a zstd upload.compression_algo, entries are compressed with
+        Zstandard (method 93) instead, using libzstd's worker threads.
+        Already-compressed formats (JPEG, PDF, ZIP) are stored without
+        recompression.
+
+        Compressed entries carry data descriptors (general purpose flag bit
+        3), so they are produced in one forward pass without seeking back to
+        patch sizes and CRCs into the local headers. Stored entries are read
+        twice instead and get the real CRC and size in the local header: a
+        reader can't find the end of stored data without them.
+
+        Args:
+            image_files: List of existing image file paths
+            compression_level: ZIP compression level (1-9), mapped onto ISA-L's 0-3
+
+        Yields:
+            Consecutive chunks of the archive
+        """
+        zstd_ctx = None
+        isal_level = 0
+        if self._zstd_level is not None:
+            zstd_ctx = _zstd.ZstdCompressor(level=self._zstd_level, threads=-1)
+        else:
+            isal_level = min(_isal_zlib.ISAL_BEST_COMPRESSION, max(compression_level, 0) // 3)
+        central_directory: List[bytes] = []
+        offset = 0
+
+        for image_file in image_files:
+            arcname = os.path.basename(image_file)
+            name = arcname.encode('utf-8')
+            method = _zip_method(image_file)
+            if method == zipfile.ZIP_DEFLATED and zstd_ctx is not None:
+                method = _ZIP_ZSTANDARD
+            version = 63 if method == _ZIP_ZSTANDARD else 20
+            stored = method == zipfile.ZIP_STORED
+            flags = 0 if stored else 0x08  # data descriptor
+            if not arcname.isascii():
+                flags |= 0x800  # UTF-8 name
+
+            fd = os.open(image_file, os.O_RDONLY)
+            try:
+                stat = os.fstat(fd)
+                dos_time, dos_date = _dos_timestamp(stat.st_mtime)
+                crc = 0
+                file_size = 0
+                if stored:
+                    while True:
+                        chunk = os.read(fd, _ZIP_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        file_size += len(chunk)
+                        crc = _crc32(chunk, crc)
+                    os.lseek(fd, 0, os.SEEK_SET)
+                header = struct.pack(
+                    '<IHHHHHIIIHH', 0x04034b50, version, flags, method,
+                    dos_time, dos_date, crc, file_size, file_size, len(name), 0,
+                ) + name
+                yield header
+
+                compressor: Any = None
+                if method == _ZIP_ZSTANDARD:
+                    compressor = zstd_ctx.compressobj()
+                elif method == zipfile.ZIP_DEFLATED:
+                    compressor = _isal_zlib.compressobj(isal_level, _isal_zlib.DEFLATED, -15)
+                compress_size = 0
+                while True:
+                    chunk = os.read(fd, _ZIP_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if not stored:
+                        file_size += len(chunk)
+                        crc = _crc32(chunk, crc)
+                    data = compressor.compress(chunk) if compressor else chunk
+                    if data:
+                        compress_size += len(data)
+                        yield data
+            finally:
+                os.close(fd)
+
+            if compressor:
+                data = compressor.flush()
+                compress_size += len(data)
+                yield data
+            if stored:
+                if compress_size != file_size:
+                    raise UploadError(f"{image_file} changed while it was being archived")
+                descriptor_size = 0
+            else:
+                yield struct.pack('<IIII', 0x08074b50, crc, compress_size, file_size)
+                descriptor_size = 16
+
+            central_directory.append(struct.pack(
+                '<IHHHHHHIIIHHHHHII', 0x02014b50, (3 << 8) | version, version, flags, method,
+                dos_time, dos_date, crc, compress_size, file_size, len(name), 0, 0, 0, 0,
+                (stat.st_mode & 0xFFFF) << 16, offset,
+            ) + name)
+            offset += len(header) + compress_size + descriptor_size
+
+        directory = b''.join(central_directory)
+        yield directory
+        yield struct.pack(
+            '<IHHHHIIH', 0x06054b50, 0, 0, len(central_directory), len(central_directory),
+            len(directory), offset, 0,
+        )
     
     def _optimize_image(self, file_path: str) -> Optional[str]:
         """Optimize image for size reduction.
@@ -164,6 +859,11 @@ class Uploader:
         if max_dim <= 0:
             return file_path
 
+        # Most pages already fit; answer from the file header alone
+        size = _image_dimensions_fast(file_path)
+        if size is not None and size[0] <= max_dim and size[1] <= max_dim:
+            return file_path
+
         try:
             img = Image.open(file_path)
             width, height = img.size
@@ -177,23 +877,28 @@ class Uploader:
             new_width = int(width * ratio)
             new_height = int(height * ratio)
 
+            # Let libjpeg downscale during the IDCT (1/2, 1/4, 1/8) so only
+            # the remaining factor is left for the resampling filter
+            if img.format == 'JPEG':
+                img.draft('RGB', (new_width, new_height))
+
             self.logger.info(
                 f"Optimizing {os.path.basename(file_path)}: {width}x{height} -> {new_width}x{new_height} | "
                 f"Format: {file_ext.upper()} | Quality: {quality}"
             )
 
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            # Large reductions (ratio measured after any JPEG draft scaling)
+            if self.config.upload_fast_resize and new_width < img.width * 0.5:
+                img = self._downscale(img, (new_width, new_height))
+            else:
+                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-            save_kwargs: Dict[str, Any] = {'optimize': True}
-            if file_ext in ('.jpg', '.jpeg'):
-                save_kwargs.update({
-                    'quality': quality,
-                    'progressive': True,
-                    'subsampling': 2,
-                })
+            if file_ext in ('jpg', 'jpeg'):
                 self.logger.info(f"JPEG settings: quality={quality}, progressive=True, subsampling=2")
-
-            img.save(file_path, **save_kwargs)
+                self._save_jpeg(img, file_path, quality)
+            else:
+                img.save(file_path, optimize=True)
+            self._forget_stats([file_path])
 
             return file_path
 
@@ -201,11 +906,31 @@ class Uploader:
             self.logger.warning(f"Failed to optimize {file_path}: {e}")
             return file_path
     
-    def _convert_to_jpeg(self, file_path: str) -> Optional[str]:
+    def _downscale(self, img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+        """Shrink an image by more than half, favouring speed over filter quality.
+
+        Uses OpenCV's area interpolation when available, otherwise Pillow's
+        LANCZOS with a reducing_gap pre-reduction.
+
+        Args:
+            img: Source image
+            size: Target (width, height)
+
+        Returns:
+            Resized image
+        """
+        if cv2 is not None and np is not None and img.mode in ('L', 'RGB', 'RGBA'):
+            resized = cv2.resize(np.asarray(img), size, interpolation=cv2.INTER_AREA)
+            return Image.fromarray(resized, img.mode)
+        return img.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+    def _convert_to_jpeg(self, file_path: str, batch_pages: int = 1) -> Optional[str]:
         """Convert image to JPEG for better compression.
 
         Args:
             file_path: Path to image file
+            batch_pages: Pages being converted in this batch; large enough
+                batches use the fused numba/TurboJPEG path for RGBA/P pages
 
         Returns:
             Path to JPEG file (same name but .jpg extension)
@@ -217,14 +942,32 @@ class Uploader:
             original_ext = os.path.splitext(file_path.lower())[1][1:]
             quality = self.config.upload_image_quality
 
-            if img.mode in ('RGBA', 'P'):
+            pixels: Any = img
+            i420: Optional[Any] = None
+            use_fused = (
+                _alpha_to_i420 is not None and _turbo is not None and batch_pages >= _FUSED_JPEG_MIN_PAGES
+            )
+            if _turbo is not None and original_ext in ('jpg', 'jpeg'):
+                # Decode straight to RGB with libjpeg-turbo instead of Pillow
+                with open(file_path, 'rb') as f:
+                    pixels = _turbo.decode(f.read(), pixel_format=TJPF_RGB)
+            elif img.mode in ('RGBA', 'P') and use_fused:
+                # Alpha flatten, colour conversion and chroma subsampling in one pass
+                i420 = self._rgba_to_i420(np.asarray(img.convert('RGBA')))
+            elif img.mode in ('RGBA', 'P') and np is not None:
+                # Composite onto white in one vectorised pass
+                rgba = np.asarray(img.convert('RGBA'))
+                rgb = rgba[..., :3].astype(np.uint16)
+                alpha = rgba[..., 3:4].astype(np.uint16)
+                pixels = ((rgb * alpha + 255 * (255 - alpha)) // 255).astype(np.uint8)
+            elif img.mode in ('RGBA', 'P'):
                 background = Image.new('RGB', img.size, (255, 255, 255))
                 if img.mode == 'P':
                     img = img.convert('RGBA')
                 background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = background
+                pixels = background
             elif img.mode != 'RGB':
-                img = img.convert('RGB')
+                pixels = img.convert('RGB')
 
             jpeg_path = os.path.splitext(file_path)[0] + '.jpg'
 
@@ -232,18 +975,25 @@ class Uploader:
                 f"Converting {os.path.basename(file_path)} to JPEG: {original_ext.upper()}({original_mode}) -> JPG(RGB) | "
                 f"Size: {original_size[0]}x{original_size[1]} | Quality: {quality}"
             )
-            self.logger.info(f"JPEG settings: quality={quality}, optimize=True, progressive=True, subsampling=2")
-
-            img.save(
-                jpeg_path,
-                quality=quality,
-                optimize=True,
-                progressive=True,
-                subsampling=2,
+            self.logger.info(
+                f"JPEG settings: quality={quality}, optimize={self.config.upload_jpeg_optimize}, "
+                f"progressive=True, subsampling=2"
             )
 
+            if i420 is not None:
+                width, height = original_size
+                with open(jpeg_path, 'wb') as f:
+                    f.write(_turbo.encode_from_yuv(
+                        i420, height, width, quality=quality,
+                        jpeg_subsample=TJSAMP_420, flags=TJFLAG_PROGRESSIVE,
+                    ))
+            else:
+                self._save_jpeg(pixels, jpeg_path, quality)
+
+            self._forget_stats([jpeg_path])
             if file_path != jpeg_path and os.path.exists(file_path):
                 os.remove(file_path)
+                self._forget_stats([file_path])
 
             return jpeg_path
 
@@ -251,14 +1001,123 @@ class Uploader:
             self.logger.warning(f"Failed to convert {file_path} to JPEG: {e}")
             return file_path
     
+    def _rgba_to_i420(self, rgba: Any) -> Any:
+        """Flatten an RGBA array onto white as a TurboJPEG I420 buffer (rows padded to 4)."""
+        height, width = rgba.shape[:2]
+        y_stride = (width + 3) & ~3
+        c_width = (width + 1) // 2
+        c_stride = (c_width + 3) & ~3
+        c_height = (height + 1) // 2
+        out = np.zeros(y_stride * height + 2 * c_stride * c_height, dtype=np.uint8)
+        _alpha_to_i420(np.ascontiguousarray(rgba), out, y_stride, c_stride, c_height)
+        return out
+
+    def _save_jpeg(self, img: Any, jpeg_path: str, quality: int) -> None:
+        """Write an image as a progressive, 4:2:0 subsampled JPEG.
+
+        Uses libjpeg-turbo via PyTurboJPEG when installed, Pillow otherwise.
+
+        Args:
+            img: PIL image, or an RGB/grayscale numpy array
+            jpeg_path: Output file path
+            quality: JPEG quality (1-100)
+        """
+        if _turbo is None:
+            if not isinstance(img, Image.Image):
+                img = Image.fromarray(img)
+            img.save(jpeg_path, quality=quality, optimize=self.config.upload_jpeg_optimize,
+                     progressive=True, subsampling=2)
+            return
+
+        if isinstance(img, Image.Image):
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            img = np.asarray(img)
+
+        if img.ndim == 2:
+            data = _turbo.encode(img, quality=quality, pixel_format=TJPF_GRAY,
+                                 jpeg_subsample=TJSAMP_GRAY, flags=TJFLAG_PROGRESSIVE)
+        else:
+            data = _turbo.encode(img, quality=quality, pixel_format=TJPF_RGB,
+                                 jpeg_subsample=TJSAMP_420, flags=TJFLAG_PROGRESSIVE)
+
+        with open(jpeg_path, 'wb') as f:
+            f.write(data)
+
     def _file_size_bytes(self, file_path: str) -> int:
-        try:
-            return os.path.getsize(file_path)
-        except OSError:
-            return 0
+        with self._stat_lock:
+            stat = self._stat_cache.get(file_path)
+        if stat is None:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                return 0
+            with self._stat_lock:
+                self._stat_cache[file_path] = stat
+        return stat.st_size
+
+    def _forget_stats(self, paths: List[str]) -> None:
+        """Drop cached stat() results of files that were changed or are done with."""
+        with self._stat_lock:
+            for path in paths:
+                self._stat_cache.pop(path, None)
+
+    def _prime_stat_cache(self, image_files: List[str]) -> None:
+        """Fill the stat cache for image_files with one directory scan per parent.
 
-    def _payload_size_bytes(self, file_paths: List[str]) -> int:
-        return sum(self._file_size_bytes(path) for path in file_paths)
+        Pages of a scan share a directory, so a single os.scandir() pass tells
+        which of them exist; missing files are left out and reported later by
+        _validated().
+
+        Args:
+            image_files: List of file paths
+        """
+        by_dir: Dict[str, Dict[str, str]] = {}
+        with self._stat_lock:
+            for image_file in image_files:
+                if image_file not in self._stat_cache:
+                    parent, name = os.path.split(image_file)
+                    by_dir.setdefault(parent, {})[name] = image_file
+
+        found: Dict[str, os.stat_result] = {}
+        for parent, wanted in by_dir.items():
+            try:
+                with os.scandir(parent or '.') as entries:
+                    for entry in entries:
+                        image_file = wanted.get(entry.name)
+                        if image_file is not None:
+                            try:
+                                found[image_file] = entry.stat()
+                            except OSError:
+                                pass
+            except OSError:
+                continue
+        with self._stat_lock:
+            self._stat_cache.update(found)
+
+    def _validated(self, image_files: List[str]) -> List[str]:
+        """Filter out missing files, stat-ing each path at most once per upload.
+
+        Args:
+            image_files: List of file paths
+
+        Returns:
+            Paths that exist, in the original order
+        """
+        valid: List[str] = []
+        for image_file in image_files:
+            with self._stat_lock:
+                cached = image_file in self._stat_cache
+            if not cached:
+                try:
+                    stat = os.stat(image_file)
+                except OSError:
+                    self.logger.warning(f"File not found, skipping: {image_file}")
+                    continue
+                with self._stat_lock:
+                    self._stat_cache[image_file] = stat
+            valid.append(image_file)
+        return valid
 
     def _prepare_file_for_zip(
         self,
@@ -277,15 +1136,67 @@ class Uploader:
                 should_force_jpeg = False
 
         if should_force_jpeg:
-            optimized = self._convert_to_jpeg(file_path)
+            optimized = self._convert_to_jpeg(file_path, batch_pages=total_pages)
         else:
             optimized = self._optimize_image(file_path)
 
         return str(optimized)
 
+    def _prepare_files(
+        self,
+        image_files: List[str],
+        auto_jpeg_threshold: int,
+        auto_jpeg_page_size_bytes: int,
+    ) -> List[str]:
+        """Prepare all page files for ZIP upload, in order.
+
+        With upload.parallel_prepare enabled, pages are optimized/converted in
+        a process pool; each worker process builds its own Uploader from the
+        same config.
+
+        Args:
+            image_files: List of page file paths
+            auto_jpeg_threshold: Page count from which all pages become JPEG (0 = disabled)
+            auto_jpeg_page_size_bytes: Page size from which a page becomes JPEG (0 = disabled)
+
+        Returns:
+            Prepared file paths, in the original page order
+        """
+        total_pages = len(image_files)
+
+        if not self.config.upload_parallel_prepare or total_pages < 2:
+            return [
+                self._prepare_file_for_zip(
+                    filepath,
+                    total_pages=total_pages,
+                    auto_jpeg_threshold=auto_jpeg_threshold,
+                    auto_jpeg_page_size_bytes=auto_jpeg_page_size_bytes,
+                )
+                for filepath in image_files
+            ]
+
+        workers = min(os.cpu_count() or 1, total_pages)
+        self.logger.info(f"Preparing {total_pages} pages with {workers} worker process(es)")
+        payloads = [
+            (filepath, total_pages, auto_jpeg_threshold, auto_jpeg_page_size_bytes)
+            for filepath in image_files
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_prepare_worker,
+            initargs=(self.config,),
+        ) as executor:
+            prepared = list(executor.map(_prepare_file_for_zip_worker, payloads, chunksize=2))
+
+        # Workers rewrote or replaced the files behind our back
+        self._forget_stats(image_files + prepared)
+
+        return prepared
+
     def _build_zip_bundles(
         self,
         prepared_files: List[str],
+        file_sizes: Dict[str, int],
         bundle_size: int,
         bundle_max_bytes: int,
     ) -> List[List[str]]:
@@ -295,7 +1206,7 @@ class Uploader:
         current_bytes = 0
 
         for file_path in prepared_files:
-            file_bytes = self._file_size_bytes(file_path)
+            file_bytes = file_sizes.get(file_path, 0)
 
             should_split = False
             if current_bundle and bundle_size > 0 and len(current_bundle) >= bundle_size:
@@ -324,6 +1235,7 @@ class Uploader:
         
         Strategy: Create document with first page, then append remaining pages one by one.
         When ZIP compression is enabled, supports bundling multiple pages per ZIP.
+        The strategy is chosen from upload.compression when the uploader is created.
         
         Args:
             image_files: List of image file paths to upload
@@ -343,89 +1255,149 @@ class Uploader:
         
         if not image_files:
             raise UploadError("No files to upload")
-        
-        compression_mode = self.config.upload_compression
-        
-        if compression_mode == "zip":
-            bundle_size = self.config.upload_zip_bundle_size
-            bundle_max_bytes = self.config.upload_zip_bundle_max_bytes
-            auto_jpeg_threshold = self.config.upload_auto_jpeg_threshold
-            auto_jpeg_page_size_bytes = self.config.upload_auto_jpeg_page_size_bytes
-
-            if auto_jpeg_threshold <= 0 and auto_jpeg_page_size_bytes <= 0:
-                if any(path.lower().endswith('.png') for path in image_files):
-                    self.logger.info(
-                        "PNG pages usually compress poorly in ZIP; consider 'scanner.format: jpeg' "
-                        "or set upload.auto_jpeg_threshold / upload.auto_jpeg_page_size_bytes"
-                    )
 
-            # If any bundling limit is configured, always go through the bundled
-            # code path (it may still produce a single bundle).
-            if bundle_size > 0 or bundle_max_bytes > 0:
-                return self._upload_bundled_zip(
-                    image_files,
-                    doc_id,
-                    metadata,
-                    document_type,
-                    properties,
-                    bundle_size=bundle_size,
-                    bundle_max_bytes=bundle_max_bytes,
-                    auto_jpeg_threshold=auto_jpeg_threshold,
-                    auto_jpeg_page_size_bytes=auto_jpeg_page_size_bytes,
+        try:
+            self._prime_stat_cache(image_files)
+            valid_files = self._validated(image_files)
+            if not valid_files:
+                raise UploadError("No valid files to upload")
+            # Serialized once here; bundled/incremental uploads reuse the bytes
+            meta_json = _dumps(metadata) if metadata else None
+            props_json = _dumps(properties) if properties else None
+            return self._upload_impl(valid_files, doc_id, meta_json, document_type, props_json)
+        finally:
+            with self._stat_lock:
+                self._stat_cache.clear()
+
+    def append_document_zip(self, doc_id: str, image_files: List[str]) -> Dict[str, Any]:
+        """Append pages to an existing document as ZIP bundle(s).
+
+        Pages are prepared and bundled with the same upload.* settings as a
+        ZIP-mode upload_document(), so a document can be sent in parts while
+        later pages are still being scanned.
+
+        Args:
+            doc_id: Document ID to append pages to
+            image_files: List of image file paths to upload
+
+        Returns:
+            Dictionary with upload result
+
+        Raises:
+            UploadError: If upload fails
+        """
+        if not self.enabled:
+            raise UploadError("HTTP upload not available - requests library missing")
+
+        try:
+            self._prime_stat_cache(image_files)
+            valid_files = self._validated(image_files)
+            if not valid_files:
+                raise UploadError("No valid files to upload")
+            return self._upload_bundled_zip(
+                valid_files,
+                bundle_size=self.config.upload_zip_bundle_size,
+                bundle_max_bytes=self.config.upload_zip_bundle_max_bytes,
+                auto_jpeg_threshold=self.config.upload_auto_jpeg_threshold,
+                auto_jpeg_page_size_bytes=self.config.upload_auto_jpeg_page_size_bytes,
+                append_to=doc_id,
+            )
+        finally:
+            with self._stat_lock:
+                self._stat_cache.clear()
+
+    def _upload_document_zip(self, image_files: List[str], doc_id: Optional[str] = None,
+                             meta_json: Optional[bytes] = None,
+                             document_type: Optional[str] = None,
+                             props_json: Optional[bytes] = None) -> Dict[str, Any]:
+        """Upload files as one or more ZIP archives."""
+        bundle_size = self.config.upload_zip_bundle_size
+        bundle_max_bytes = self.config.upload_zip_bundle_max_bytes
+        auto_jpeg_threshold = self.config.upload_auto_jpeg_threshold
+        auto_jpeg_page_size_bytes = self.config.upload_auto_jpeg_page_size_bytes
+
+        if auto_jpeg_threshold <= 0 and auto_jpeg_page_size_bytes <= 0:
+            if any(path.lower().endswith('.png') for path in image_files):
+                self.logger.info(
+                    "PNG pages usually compress poorly in ZIP; consider 'scanner.format: jpeg' "
+                    "or set upload.auto_jpeg_threshold / upload.auto_jpeg_page_size_bytes"
                 )
 
-            return self._upload_single_zip(
+        # If any bundling limit is configured, always go through the bundled
+        # code path (it may still produce a single bundle).
+        if bundle_size > 0 or bundle_max_bytes > 0:
+            return self._upload_bundled_zip(
                 image_files,
                 doc_id,
-                metadata,
+                meta_json,
                 document_type,
-                properties,
+                props_json,
+                bundle_size=bundle_size,
+                bundle_max_bytes=bundle_max_bytes,
                 auto_jpeg_threshold=auto_jpeg_threshold,
                 auto_jpeg_page_size_bytes=auto_jpeg_page_size_bytes,
             )
-        
-        return self._upload_incremental(image_files, doc_id, metadata, document_type, properties)
+
+        return self._upload_single_zip(
+            image_files,
+            doc_id,
+            meta_json,
+            document_type,
+            props_json,
+            auto_jpeg_threshold=auto_jpeg_threshold,
+            auto_jpeg_page_size_bytes=auto_jpeg_page_size_bytes,
+        )
     
     def _upload_single_zip(
         self,
         image_files: List[str],
         doc_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None,
+        meta_json: Optional[bytes] = None,
         document_type: Optional[str] = None,
-        properties: Optional[Dict[str, Any]] = None,
+        props_json: Optional[bytes] = None,
         auto_jpeg_threshold: int = 0,
         auto_jpeg_page_size_bytes: int = 0,
     ) -> Dict[str, Any]:
         """Upload files as a single ZIP archive."""
         self.logger.info(f"Creating single ZIP archive for {len(image_files)} pages")
 
-        optimized_files: List[str] = []
         try:
-            total_pages = len(image_files)
-            for filepath in image_files:
-                optimized_files.append(
-                    self._prepare_file_for_zip(
-                        filepath,
-                        total_pages=total_pages,
-                        auto_jpeg_threshold=auto_jpeg_threshold,
-                        auto_jpeg_page_size_bytes=auto_jpeg_page_size_bytes,
-                    )
-                )
+            optimized_files = self._prepare_files(
+                image_files,
+                auto_jpeg_threshold=auto_jpeg_threshold,
+                auto_jpeg_page_size_bytes=auto_jpeg_page_size_bytes,
+            )
 
             compression_level = self.config.upload_zip_compression_level
             self.logger.info(f"ZIP compression level: {compression_level}")
-            zip_path = self._compress_to_zip(optimized_files, compression_level)
 
-            zip_size = self._file_size_bytes(zip_path)
-            self.logger.info(f"ZIP payload size: {_format_size(zip_size)} ({len(optimized_files)} pages)")
+            if self._can_stream_zip(optimized_files):
+                result = self._create_document(
+                    optimized_files,
+                    doc_id=doc_id,
+                    meta_json=meta_json,
+                    document_type=document_type,
+                    props_json=props_json,
+                    zip_level=compression_level,
+                )
+                zip_size = result['payload_bytes']
+            else:
+                zip_path = self._compress_to_zip(optimized_files, compression_level)
+
+                zip_size = self._file_size_bytes(zip_path)
+                self.logger.info(f"ZIP payload size: {_format_size(zip_size)} ({len(optimized_files)} pages)")
 
-            result = self._create_document(
-                [zip_path],
-                doc_id=doc_id,
-                metadata=metadata,
-                document_type=document_type,
-                properties=properties,
-            )
+                result = self._create_document(
+                    [zip_path],
+                    doc_id=doc_id,
+                    meta_json=meta_json,
+                    document_type=document_type,
+                    props_json=props_json,
+                )
+
+                if os.path.exists(zip_path):
+                    os.remove(zip_path)
+                self._forget_stats([zip_path])
 
             result.update({
                 'payload_bytes': zip_size,
@@ -433,9 +1405,6 @@ class Uploader:
                 'bundles': 1,
             })
 
-            if os.path.exists(zip_path):
-                os.remove(zip_path)
-
             return result
 
         except Exception as e:
@@ -448,15 +1417,20 @@ class Uploader:
         self,
         image_files: List[str],
         doc_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None,
+        meta_json: Optional[bytes] = None,
         document_type: Optional[str] = None,
-        properties: Optional[Dict[str, Any]] = None,
+        props_json: Optional[bytes] = None,
         bundle_size: int = 0,
         bundle_max_bytes: int = 0,
         auto_jpeg_threshold: int = 0,
         auto_jpeg_page_size_bytes: int = 0,
+        append_to: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Upload files as one or more ZIP bundles."""
+        """Upload files as one or more ZIP bundles.
+
+        With append_to set, every bundle is appended to that existing
+        document instead of the first one creating a new document.
+        """
         total_pages = len(image_files)
 
         limits = []
@@ -472,65 +1446,98 @@ class Uploader:
             f"Total pages: {total_pages}"
         )
 
-        prepared_files: List[str] = []
-        for filepath in image_files:
-            prepared_files.append(
-                self._prepare_file_for_zip(
-                    filepath,
-                    total_pages=total_pages,
-                    auto_jpeg_threshold=auto_jpeg_threshold,
-                    auto_jpeg_page_size_bytes=auto_jpeg_page_size_bytes,
-                )
-            )
+        prepared_files = self._prepare_files(
+            image_files,
+            auto_jpeg_threshold=auto_jpeg_threshold,
+            auto_jpeg_page_size_bytes=auto_jpeg_page_size_bytes,
+        )
 
-        bundles = self._build_zip_bundles(prepared_files, bundle_size=bundle_size, bundle_max_bytes=bundle_max_bytes)
+        # Sizes are taken once after preparation, which may have rewritten the files
+        file_sizes = {path: self._file_size_bytes(path) for path in prepared_files}
+        bundles = self._build_zip_bundles(
+            prepared_files, file_sizes, bundle_size=bundle_size, bundle_max_bytes=bundle_max_bytes
+        )
 
-        created_doc_id: Optional[str] = None
+        created_doc_id: Optional[str] = append_to
         total_pages_uploaded = 0
         bundle_payload_bytes: List[int] = []
 
-        for bundle_num, bundle_files in enumerate(bundles, start=1):
-            self.logger.info(f"Bundle {bundle_num}/{len(bundles)}: {len(bundle_files)} pages")
+        # Bundle N+1 is compressed on a worker thread while bundle N uploads;
+        # uploads stay sequential so pages keep their order.
+        zip_futures: Dict[int, Future] = {}
 
-            zip_path = self._compress_to_zip(bundle_files, compression_level)
-            zip_size = self._file_size_bytes(zip_path)
-            bundle_payload_bytes.append(zip_size)
-
-            self.logger.info(f"Bundle {bundle_num} payload: {_format_size(zip_size)}")
-            if bundle_max_bytes > 0 and zip_size > bundle_max_bytes:
-                self.logger.warning(
-                    f"Bundle {bundle_num} exceeds zip_bundle_max_bytes ({_format_size(zip_size)} > {_format_size(bundle_max_bytes)})"
-                )
+        def schedule_compression(index: int) -> None:
+            if index < len(bundles) and not self._can_stream_zip(bundles[index]):
+                zip_futures[index] = executor.submit(self._compress_to_zip, bundles[index], compression_level)
 
+        with ThreadPoolExecutor(max_workers=1) as executor:
             try:
-                if bundle_num == 1:
-                    result = self._create_document(
-                        [zip_path],
-                        doc_id=doc_id,
-                        metadata=metadata,
-                        document_type=document_type,
-                        properties=properties,
-                    )
-                    created_doc_id = result.get('doc_id')
-                    if created_doc_id:
-                        self.logger.info(f"Document created: {created_doc_id}")
-                    pages_added = result.get('pages_added', len(bundle_files))
-                else:
-                    if not created_doc_id:
-                        raise UploadError("Missing document ID for bundle append")
-                    result = self._append_pages(str(created_doc_id), [zip_path])
-                    pages_added = result.get('pages_added', len(bundle_files))
-
-                total_pages_uploaded += pages_added
-
-            except Exception as e:
-                error_msg = f"Failed to upload bundle {bundle_num}: {e}"
-                self.logger.error(error_msg)
-                self.log_error(error_msg, level="error", details={"bundle": bundle_num, "files": len(bundle_files)})
-                raise UploadError(error_msg)
+                schedule_compression(0)
+                for bundle_num, bundle_files in enumerate(bundles, start=1):
+                    self.logger.info(f"Bundle {bundle_num}/{len(bundles)}: {len(bundle_files)} pages")
+                    schedule_compression(bundle_num)
+
+                    # Streamed bundles are archived on the fly; otherwise use the prebuilt ZIP
+                    zip_level: Optional[int] = None
+                    zip_path = ''
+                    zip_future = zip_futures.pop(bundle_num - 1, None)
+                    if zip_future is None:
+                        payload_files = bundle_files
+                        zip_level = compression_level
+                    else:
+                        zip_path = zip_future.result()
+                        payload_files = [zip_path]
+                        self.logger.info(
+                            f"Bundle {bundle_num} payload: {_format_size(self._file_size_bytes(zip_path))}"
+                        )
+
+                    try:
+                        if bundle_num == 1 and append_to is None:
+                            result = self._create_document(
+                                payload_files,
+                                doc_id=doc_id,
+                                meta_json=meta_json,
+                                document_type=document_type,
+                                props_json=props_json,
+                                zip_level=zip_level,
+                            )
+                            created_doc_id = result.get('doc_id')
+                            if created_doc_id:
+                                self.logger.info(f"Document created: {created_doc_id}")
+                            pages_added = result.get('pages_added', len(bundle_files))
+                        else:
+                            if not created_doc_id:
+                                raise UploadError("Missing document ID for bundle append")
+                            result = self._append_pages(str(created_doc_id), payload_files, zip_level=zip_level)
+                            pages_added = result.get('pages_added', len(bundle_files))
+
+                        total_pages_uploaded += pages_added
+
+                        zip_size = result['payload_bytes']
+                        bundle_payload_bytes.append(zip_size)
+                        if bundle_max_bytes > 0 and zip_size > bundle_max_bytes:
+                            self.logger.warning(
+                                f"Bundle {bundle_num} exceeds zip_bundle_max_bytes ({_format_size(zip_size)} > {_format_size(bundle_max_bytes)})"
+                            )
+
+                    except Exception as e:
+                        error_msg = f"Failed to upload bundle {bundle_num}: {e}"
+                        self.logger.error(error_msg)
+                        self.log_error(error_msg, level="error", details={"bundle": bundle_num, "files": len(bundle_files)})
+                        raise UploadError(error_msg)
+                    finally:
+                        if zip_path and os.path.exists(zip_path):
+                            os.remove(zip_path)
+                        self._forget_stats([zip_path])
             finally:
-                if os.path.exists(zip_path):
-                    os.remove(zip_path)
+                # Discard the archive prepared ahead if we stopped early
+                for zip_future in zip_futures.values():
+                    try:
+                        leftover = zip_future.result()
+                    except Exception:
+                        continue
+                    if os.path.exists(leftover):
+                        os.remove(leftover)
 
         total_payload = sum(bundle_payload_bytes)
         self.logger.info(
@@ -550,41 +1557,90 @@ class Uploader:
         }
     
     def _upload_incremental(self, image_files: List[str], doc_id: Optional[str] = None,
-                           metadata: Optional[Dict[str, Any]] = None,
+                           meta_json: Optional[bytes] = None,
                            document_type: Optional[str] = None,
-                           properties: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Upload files incrementally page by page."""
+                           props_json: Optional[bytes] = None) -> Dict[str, Any]:
+        """Upload files incrementally page by page.
+
+        A background thread optimizes the next page(s) while the current one
+        is being posted; uploads themselves stay strictly sequential.
+        """
         self.logger.info(f"Uploading {len(image_files)} pages incrementally")
-        
-        first_page = image_files[0]
-        first_size = os.path.getsize(first_page)
-        self.logger.info(f"First page payload: {_format_size(first_size)}")
-        
-        result = self._create_document(
-            [first_page],
-            doc_id=doc_id,
-            metadata=metadata,
-            document_type=document_type,
-            properties=properties
-        )
-        
-        created_doc_id = result.get('doc_id')
-        if not created_doc_id:
-            raise UploadError("Failed to get document ID from create response")
-        
-        self.logger.info(f"Document created with ID: {created_doc_id}")
-        
-        total_pages_added = result.get('pages_added', 1)
-        
-        if len(image_files) > 1:
-            for i, page_file in enumerate(image_files[1:], start=2):
-                page_size = os.path.getsize(page_file)
-                self.logger.info(f"Appending page {i}/{len(image_files)}: {_format_size(page_size)}")
+
+        pages: 'queue.Queue[Optional[Tuple[str, int]]]' = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def take_page() -> Tuple[str, int]:
+            item = pages.get()
+            if item is None:
+                raise UploadError("Page preparation stopped before the last page")
+            return item
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(self._prefetch_pages, image_files, pages, stop)
+            try:
+                first_page, first_size = take_page()
+                self.logger.info(f"First page payload: {_format_size(first_size)}")
+                
+                result = self._create_document(
+                    [first_page],
+                    doc_id=doc_id,
+                    meta_json=meta_json,
+                    document_type=document_type,
+                    props_json=props_json
+                )
+                
+                created_doc_id = result.get('doc_id')
+                if not created_doc_id:
+                    raise UploadError("Failed to get document ID from create response")
                 
-                append_result = self._append_pages(created_doc_id, [page_file])
-                total_pages_added += append_result.get('pages_added', 1)
+                self.logger.info(f"Document created with ID: {created_doc_id}")
                 
-                self.logger.info(f"Page {i} appended. Total pages: {append_result.get('total_pages', total_pages_added)}")
+                total_pages_added = result.get('pages_added', 1)
+
+                # Batched appends reuse the ZIP bundle limits; otherwise one page per request
+                if self.config.upload_append_batch:
+                    batch_size = self.config.upload_zip_bundle_size
+                    batch_max_bytes = self.config.upload_zip_bundle_max_bytes
+                else:
+                    batch_size = 1
+                    batch_max_bytes = 0
+
+                batch: List[str] = []
+                batch_bytes = 0
+                next_page = 2
+                for _ in range(len(image_files) - 1):
+                    page_file, page_size = take_page()
+
+                    should_split = False
+                    if batch and batch_size > 0 and len(batch) >= batch_size:
+                        should_split = True
+                    if batch and batch_max_bytes > 0 and batch_bytes + page_size > batch_max_bytes:
+                        should_split = True
+
+                    if should_split:
+                        total_pages_added = self._append_batch(
+                            created_doc_id, batch, batch_bytes, next_page, len(image_files), total_pages_added
+                        )
+                        next_page += len(batch)
+                        batch = []
+                        batch_bytes = 0
+
+                    batch.append(page_file)
+                    batch_bytes += page_size
+
+                if batch:
+                    total_pages_added = self._append_batch(
+                        created_doc_id, batch, batch_bytes, next_page, len(image_files), total_pages_added
+                    )
+            finally:
+                # Unblock the producer if we bailed out early
+                stop.set()
+                while True:
+                    try:
+                        pages.get_nowait()
+                    except queue.Empty:
+                        break
         
         return {
             'success': True,
@@ -594,18 +1650,149 @@ class Uploader:
             'total_pages': total_pages_added
         }
     
+    def _append_batch(self, doc_id: str, batch: List[str], batch_bytes: int,
+                      first_page: int, page_count: int, total_pages_added: int) -> int:
+        """Append one batch of consecutive pages and log progress.
+
+        Args:
+            doc_id: Document ID to append pages to
+            batch: Page file paths to send in one request
+            batch_bytes: Combined size of the batch
+            first_page: 1-based page number of the first page in the batch
+            page_count: Total number of pages in the upload
+            total_pages_added: Pages added so far
+
+        Returns:
+            Updated number of pages added
+        """
+        last_page = first_page + len(batch) - 1
+        pages_label = f"page {first_page}" if len(batch) == 1 else f"pages {first_page}-{last_page}"
+        self.logger.info(f"Appending {pages_label}/{page_count}: {_format_size(batch_bytes)}")
+
+        append_result = self._append_pages(doc_id, batch)
+        total_pages_added += append_result.get('pages_added', len(batch))
+
+        self.logger.info(
+            f"{pages_label.capitalize()} appended. Total pages: {append_result.get('total_pages', total_pages_added)}"
+        )
+        return total_pages_added
+
+    def _prefetch_pages(self, image_files: List[str], pages: 'queue.Queue[Optional[Tuple[str, int]]]',
+                        stop: threading.Event) -> None:
+        """Optimize pages ahead of the incremental upload loop.
+
+        Args:
+            image_files: Page file paths, in upload order
+            pages: Bounded queue receiving (path, size) per prepared page,
+                   then None once no more pages follow
+            stop: Set by the consumer when it stops reading from the queue
+        """
+        try:
+            for page_file in image_files:
+                if stop.is_set():
+                    return
+                try:
+                    prepared = str(self._optimize_image(page_file))
+                except Exception as e:
+                    self.logger.warning(f"Failed to prepare {page_file}: {e}")
+                    prepared = page_file
+                pages.put((prepared, self._file_size_bytes(prepared)))
+        except Exception as e:
+            self.logger.error(f"Page preparation failed: {e}")
+        finally:
+            # Wakes the consumer if this thread died before the last page;
+            # the queue has room, as the consumer drains it after stopping
+            pages.put(None)
+
+    def _post_pages(self, api_url: str, image_files: List[str], fields: Dict[str, Any],
+                    zip_level: Optional[int] = None) -> Tuple[Any, int]:
+        """POST page files to the API and check the response status.
+
+        Args:
+            api_url: Document endpoint to post to
+            image_files: List of image file paths to upload
+            fields: Form fields sent next to the files
+            zip_level: If set, stream image_files as one ZIP archive at this level
+
+        Returns:
+            Tuple of (response, payload bytes sent)
+
+        Raises:
+            UploadError: If no file is valid or the server rejects the request
+        """
+        try:
+            # Prepare files for multipart upload; the stack closes every opened
+            # handle however this method exits
+            files = []
+            with contextlib.ExitStack() as stack:
+                payload_bytes = 0
+                stream_files: List[str] = []
+
+                if zip_level is not None:
+                    stream_files = self._validated(image_files)
+                else:
+                    for image_file in self._validated(image_files):
+                        filename = os.path.basename(image_file)
+                        content_type = self._guess_mime_type(image_file)
+                        size_bytes = self._file_size_bytes(image_file)
+                        payload_bytes += size_bytes
+
+                        self.logger.debug(f"Payload file: {filename} ({_format_size(size_bytes)})")
+                        files.append(('files', (filename, self._open_upload_stream(stack, image_file), content_type)))
+
+                if not files and not stream_files:
+                    raise UploadError("No valid files to upload")
+
+                # Make request (sendfile, if enabled, skips requests' userspace copy)
+                if stream_files:
+                    self.logger.info(f"Streaming ZIP payload: {len(stream_files)} page(s) -> {api_url}")
+                    response, payload_bytes = self._post_zip_stream(
+                        api_url, stream_files, cast(int, zip_level), fields
+                    )
+                    self.logger.info(f"Streamed ZIP payload: {_format_size(payload_bytes)}")
+                else:
+                    self.logger.info(
+                        f"Uploading payload: {len(files)} file(s), {_format_size(payload_bytes)} -> {api_url}"
+                    )
+                    if self._sends_zero_copy(files):
+                        response = self._post_files_zero_copy(api_url, files, fields)
+                    else:
+                        response = self._post_multipart(api_url, files, fields)
+        finally:
+            # Uploaded or not, these files need no further stat lookups
+            self._forget_stats(image_files)
+
+        if response.status_code not in [200, 201]:
+            raise UploadError(f"HTTP {response.status_code}: {response.text}")
+        return response, payload_bytes
+
+    @staticmethod
+    def _form_fields(document_type: Optional[str], meta_json: Optional[bytes],
+                     props_json: Optional[bytes]) -> Dict[str, Any]:
+        """Build the form fields sent next to the page files."""
+        fields: Dict[str, Any] = {}
+        if meta_json:
+            fields['meta'] = meta_json
+        if document_type:
+            fields['documentType'] = document_type
+        if props_json:
+            fields['properties'] = props_json
+        return fields
+
     def _create_document(self, image_files: List[str], doc_id: Optional[str] = None,
-                        metadata: Optional[Dict[str, Any]] = None,
                         document_type: Optional[str] = None,
-                        properties: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                        zip_level: Optional[int] = None,
+                        meta_json: Optional[bytes] = None,
+                        props_json: Optional[bytes] = None) -> Dict[str, Any]:
         """Create a new document with initial page(s).
         
         Args:
             image_files: List of image file paths to upload
             doc_id: Optional document ID (will be generated if not provided)
-            metadata: Optional document metadata
             document_type: Optional document type ID
-            properties: Optional document properties
+            zip_level: If set, stream image_files as one ZIP archive at this level
+            meta_json: Optional serialized document metadata
+            props_json: Optional serialized document properties
             
         Returns:
             Dictionary with upload result
@@ -613,104 +1800,51 @@ class Uploader:
         Raises:
             UploadError: If upload fails
         """
-        # Build API URL
         # Format: {base_url}/{workspace}/api/document/
-        api_url = f"{self.config.api_url}/{self.config.api_workspace}/api/document/"
-
-        # Prepare files for multipart upload
-        files = []
+        api_url = f"{self._api_base}/document/"
+        fields = self._form_fields(document_type, meta_json, props_json)
         try:
-            payload_bytes = 0
-
-            for image_file in image_files:
-                if not os.path.exists(image_file):
-                    self.logger.warning(f"File not found, skipping: {image_file}")
-                    continue
-
-                filename = os.path.basename(image_file)
-                content_type = self._guess_mime_type(image_file)
-                size_bytes = self._file_size_bytes(image_file)
-                payload_bytes += size_bytes
-
-                self.logger.debug(f"Payload file: {filename} ({_format_size(size_bytes)})")
-                files.append(('files', (filename, open(image_file, 'rb'), content_type)))
-            
-            if not files:
-                raise UploadError("No valid files to upload")
-            
-            # Prepare form data
-            data = {}
-            if metadata:
-                data['meta'] = json.dumps(metadata)
-            if document_type:
-                data['documentType'] = document_type
-            if properties:
-                data['properties'] = json.dumps(properties)
-            
-            # Prepare headers
-            headers = {}
-            if self.config.api_token:
-                headers['Authorization'] = f'Bearer {self.config.api_token}'
-            
-            self.logger.info(
-                f"Uploading payload: {len(files)} file(s), {_format_size(payload_bytes)} -> {api_url}"
-            )
-
-            # Make request
-            response = requests.post(  # type: ignore
-                api_url,
-                files=files,
-                data=data,
-                headers=headers,
-                timeout=self.config.api_timeout
-            )
-            
-            # Close file handles
-            for _, (_, file_obj, _) in files:
-                file_obj.close()
-            
-            # Handle response
-            if response.status_code in [200, 201]:
-                try:
-                    result = response.json()
-                    self.logger.info(f"Document created successfully: {result}")
-                    return {
-                        'success': True,
-                        'response': result,
-                        'doc_id': result.get('docId'),
-                        'pages_added': result.get('pagesAdded', len(image_files)),
-                        'total_pages': result.get('totalPages', len(image_files))
-                    }
-                except json.JSONDecodeError:
-                    self.logger.warning("Response was not valid JSON")
-                    return {
-                        'success': True,
-                        'response': response.text,
-                        'doc_id': doc_id,
-                        'pages_added': len(image_files),
-                        'total_pages': len(image_files)
-                    }
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                self.logger.error(f"Document creation failed: {error_msg}")
-                raise UploadError(error_msg)
-                
+            response, payload_bytes = self._post_pages(api_url, image_files, fields, zip_level)
         except Exception as e:
             self.logger.error(f"Document creation error: {e}")
             raise UploadError(f"Document creation error: {e}")
+
+        try:
+            result = response.json()
+        except json.JSONDecodeError:
+            self.logger.warning("Response was not valid JSON")
+            return {
+                'success': True,
+                'response': response.text,
+                'doc_id': doc_id,
+                'pages_added': len(image_files),
+                'total_pages': len(image_files),
+                'payload_bytes': payload_bytes,
+            }
+        self.logger.info(f"Document created successfully: {result}")
+        return {
+            'success': True,
+            'response': result,
+            'doc_id': result.get('docId'),
+            'pages_added': result.get('pagesAdded', len(image_files)),
+            'total_pages': result.get('totalPages', len(image_files)),
+            'payload_bytes': payload_bytes,
+        }
     
     def _append_pages(self, doc_id: str, image_files: List[str],
-                     metadata: Optional[Dict[str, Any]] = None,
                      document_type: Optional[str] = None,
-                     properties: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                     zip_level: Optional[int] = None,
+                     meta_json: Optional[bytes] = None,
+                     props_json: Optional[bytes] = None) -> Dict[str, Any]:
         """Append page(s) to an existing document.
         
         Args:
             doc_id: Document ID to append pages to
             image_files: List of image file paths to upload
-            metadata: Optional document metadata
             document_type: Optional document type ID
-            properties: Optional document properties
+            zip_level: If set, stream image_files as one ZIP archive at this level
+            meta_json: Optional serialized document metadata
+            props_json: Optional serialized document properties
             
         Returns:
             Dictionary with upload result
@@ -718,92 +1852,174 @@ class Uploader:
         Raises:
             UploadError: If upload fails
         """
-        # Build API URL
         # Format: {base_url}/{workspace}/api/document/{docId}
-        api_url = f"{self.config.api_url}/{self.config.api_workspace}/api/document/{doc_id}"
+        api_url = f"{self._api_base}/document/{doc_id}"
+        fields = self._form_fields(document_type, meta_json, props_json)
+        try:
+            response, payload_bytes = self._post_pages(api_url, image_files, fields, zip_level)
+        except Exception as e:
+            self.logger.error(f"Page append error: {e}")
+            raise UploadError(f"Page append error: {e}")
 
-        # Prepare files for multipart upload
-        files = []
         try:
-            payload_bytes = 0
+            result = response.json()
+        except json.JSONDecodeError:
+            self.logger.warning("Response was not valid JSON")
+            return {
+                'success': True,
+                'response': response.text,
+                'doc_id': doc_id,
+                'pages_added': len(image_files),
+                'total_pages': None,
+                'payload_bytes': payload_bytes,
+            }
+        self.logger.info(f"Pages appended successfully: {result}")
+        return {
+            'success': True,
+            'response': result,
+            'doc_id': result.get('docId', doc_id),
+            'pages_added': result.get('pagesAdded', len(image_files)),
+            'total_pages': result.get('totalPages'),
+            'payload_bytes': payload_bytes,
+        }
+    
+    def append_pages_buffered(self, doc_id: str, file_path: str, flush_size: int = 1,
+                              flush_interval: float = 2.0) -> Optional[Dict[str, Any]]:
+        """Queue a page for appending and send the queue in one request.
 
-            for image_file in image_files:
-                if not os.path.exists(image_file):
-                    self.logger.warning(f"File not found, skipping: {image_file}")
-                    continue
+        The queue is sent once it holds flush_size pages, or flush_interval
+        seconds after its first page was queued. Call flush() after the last
+        page to send the remainder. Pages of a failed request stay queued and
+        are sent again with the next batch.
 
-                filename = os.path.basename(image_file)
-                content_type = self._guess_mime_type(image_file)
-                size_bytes = self._file_size_bytes(image_file)
-                payload_bytes += size_bytes
+        Args:
+            doc_id: Document ID to append the page to
+            file_path: Image file path of the page
+            flush_size: Number of pages sent per append request
+            flush_interval: Seconds after which a partial queue is sent
 
-                self.logger.debug(f"Payload file: {filename} ({_format_size(size_bytes)})")
-                files.append(('files', (filename, open(image_file, 'rb'), content_type)))
-            
-            if not files:
-                raise UploadError("No valid files to upload")
-            
-            # Prepare form data
-            data = {}
-            if metadata:
-                data['meta'] = json.dumps(metadata)
-            if document_type:
-                data['documentType'] = document_type
-            if properties:
-                data['properties'] = json.dumps(properties)
-            
-            # Prepare headers
-            headers = {}
-            if self.config.api_token:
-                headers['Authorization'] = f'Bearer {self.config.api_token}'
-            
-            self.logger.info(
-                f"Uploading payload: {len(files)} file(s), {_format_size(payload_bytes)} -> {api_url}"
-            )
+        Returns:
+            Append result if this call sent the queue, otherwise None
+
+        Raises:
+            UploadError: If sending the queue failed (the pages stay queued)
+        """
+        leftovers = None
+        with self._pending_cond:
+            if self._pending_doc_id != doc_id:
+                leftovers = self._take_pending()
+                self._pending_doc_id = doc_id
+        if leftovers is not None:
+            # Another document was never flushed; send its pages, but don't
+            # fail this document for their errors
+            try:
+                self._send_batch(leftovers)
+            except UploadError as e:
+                self.logger.error(
+                    f"Dropped {len(leftovers[1])} page(s) queued for document {leftovers[0]}: {e}"
+                )
+
+        with self._pending_cond:
+            self._pending.append(file_path)
+            if len(self._pending) < flush_size:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(flush_interval, self._flush_on_timer)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return None
+            batch = self._take_pending()
+        return self._send_batch(batch)
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Send pages queued by append_pages_buffered().
+
+        Waits for a batch that is already being sent, then sends whatever is
+        still queued, including pages of an earlier failed request.
+
+        Returns:
+            Append result, or None if nothing was queued
+
+        Raises:
+            UploadError: If the append failed (the pages stay queued)
+        """
+        with self._pending_cond:
+            batch = self._take_pending()
+        return self._send_batch(batch)
+
+    def discard_pending(self) -> List[str]:
+        """Drop pages queued by append_pages_buffered() without sending them.
+
+        Cancels the flush timer and waits for a batch that is already being
+        sent. Call this before deleting the page files of an upload that is
+        given up on, so no timer later posts pages that are gone.
+
+        Returns:
+            Paths of the dropped pages
+        """
+        with self._pending_cond:
+            while self._flushing:
+                self._pending_cond.wait()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            doc_id = self._pending_doc_id
+            pages, self._pending = self._pending, []
+            self._pending_doc_id = None
+        if pages:
+            self.logger.warning(f"Dropped {len(pages)} queued page(s) of document {doc_id}")
+        return pages
+
+    def _flush_on_timer(self) -> None:
+        """Timer callback; a failed batch stays queued for the next flush."""
+        with self._pending_cond:
+            # A flush may have raced this timer and already sent the pages
+            if self._flush_timer is not threading.current_thread():
+                return
+            self._flush_timer = None
+            batch = self._take_pending()
+        try:
+            self._send_batch(batch)
+        except UploadError as e:
+            self.logger.warning(f"Timed page append failed, pages kept for the next flush: {e}")
+
+    def _take_pending(self) -> Optional[Tuple[str, List[str]]]:
+        """Claim the queued pages for sending. Caller holds _pending_cond.
+
+        Waits until no other batch is in flight and marks this one as such;
+        pass the result to _send_batch().
+
+        Returns:
+            (document ID, pages), or None if nothing is queued
+        """
+        while self._flushing:
+            self._pending_cond.wait()
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return None
+        pages, self._pending = self._pending, []
+        self._flushing = True
+        return cast(str, self._pending_doc_id), pages
+
+    def _send_batch(self, batch: Optional[Tuple[str, List[str]]]) -> Optional[Dict[str, Any]]:
+        """Post a batch from _take_pending() without holding the lock."""
+        if batch is None:
+            return None
+        doc_id, pages = batch
+        sent = False
+        try:
+            result = self._append_pages(doc_id, pages)
+            sent = True
+            return result
+        finally:
+            with self._pending_cond:
+                if not sent and self._pending_doc_id == doc_id:
+                    # Put the pages back in front of anything queued meanwhile
+                    self._pending[:0] = pages
+                self._flushing = False
+                self._pending_cond.notify_all()
 
-            # Make request
-            response = requests.post(  # type: ignore
-                api_url,
-                files=files,
-                data=data,
-                headers=headers,
-                timeout=self.config.api_timeout
-            )
-            
-            # Close file handles
-            for _, (_, file_obj, _) in files:
-                file_obj.close()
-            
-            # Handle response
-            if response.status_code in [200, 201]:
-                try:
-                    result = response.json()
-                    self.logger.info(f"Pages appended successfully: {result}")
-                    return {
-                        'success': True,
-                        'response': result,
-                        'doc_id': result.get('docId', doc_id),
-                        'pages_added': result.get('pagesAdded', len(image_files)),
-                        'total_pages': result.get('totalPages')
-                    }
-                except json.JSONDecodeError:
-                    self.logger.warning("Response was not valid JSON")
-                    return {
-                        'success': True,
-                        'response': response.text,
-                        'doc_id': doc_id,
-                        'pages_added': len(image_files),
-                        'total_pages': None
-                    }
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                self.logger.error(f"Page append failed: {error_msg}")
-                raise UploadError(error_msg)
-                
-        except Exception as e:
-            self.logger.error(f"Page append error: {e}")
-            raise UploadError(f"Page append error: {e}")
-    
     def test_connection(self) -> Dict[str, Any]:
         """Test connection to API.
         
@@ -818,17 +2034,9 @@ class Uploader:
         
         try:
             # Test with a simple GET request to the base URL
-            test_url = f"{self.config.api_url}/{self.config.api_workspace}/api/"
+            test_url = f"{self._api_base}/"
             
-            headers = {}
-            if self.config.api_token:
-                headers['Authorization'] = f'Bearer {self.config.api_token}'
-            
-            response = requests.get(  # type: ignore
-                test_url,
-                headers=headers,
-                timeout=self.config.api_timeout
-            )
+            response = self._session.get(test_url, timeout=self._timeout)
             
             if response.status_code in [200, 404]:  # 404 is OK for API root
                 return {
@@ -849,6 +2057,15 @@ class Uploader:
                 'error': str(e)
             }
     
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        with self._pending_cond:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        if self._session is not None:
+            self._session.close()
+
     def get_upload_stats(self, image_files: List[str]) -> Dict[str, Any]:
         """Get statistics about files to be uploaded.
         
@@ -865,21 +2082,24 @@ class Uploader:
         }
         
         for image_file in image_files:
-            if os.path.exists(image_file):
-                size = os.path.getsize(image_file)
-                stats['total_size'] += size
-                stats['files'].append({
-                    'name': os.path.basename(image_file),
-                    'size': size,
-                    'path': image_file
-                })
-            else:
+            name = os.path.basename(image_file)
+            try:
+                size = os.stat(image_file).st_size
+            except FileNotFoundError:
                 stats['files'].append({
-                    'name': os.path.basename(image_file),
+                    'name': name,
                     'size': 0,
                     'path': image_file,
                     'error': 'File not found'
                 })
+                continue
+
+            stats['total_size'] += size
+            stats['files'].append({
+                'name': name,
+                'size': size,
+                'path': image_file
+            })
         
         return stats
 
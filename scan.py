@@ -4,7 +4,10 @@
 import os
 import sys
 import argparse
-from datetime import datetime
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -26,184 +29,325 @@ def _format_size(size_bytes: int) -> str:
     return f"{size:.1f} TB"
 
 
-def scan_document(config, source=None, format_type=None, debug=False, max_pages=None):
-    """Scan a document and upload to API."""
-    
-    sound_player = None
-    
-    if source:
-        config.set('scanner.source', source)
-    if format_type:
-        config.set('scanner.format', format_type)
-    
-    file_manager = FileManager(config)
-    scan_dir = file_manager.create_scan_directory()
-    
-    if debug:
-        print(f"Scan directory: {scan_dir}")
-        print(f"Max pages: {max_pages}")
-        print(f"Color correction: {config.scanner_color_correction}")
-        print(f"Upload compression: {config.upload_compression}")
-        print(f"ZIP bundle size: {config.upload_zip_bundle_size}")
-        print(f"ZIP bundle max bytes: {config.upload_zip_bundle_max_bytes}")
-        print(f"Auto JPEG threshold: {config.upload_auto_jpeg_threshold}")
-        print(f"Auto JPEG page bytes: {config.upload_auto_jpeg_page_size_bytes}")
-    
-    try:
-        uploader = Uploader(config)
-        scanner = Scanner(config, uploader=uploader)
-        blank_detector = BlankPageDetector(config)
-        sound_player = SoundPlayer(config)
-        
-        if debug:
-            print(f"Scanner device: {scanner.device}")
-            print(f"Scanner source: {config.scanner_source}")
-            print(f"Scanner mode: {config.scanner_mode}")
-        
-        compression_mode = config.upload_compression
-        bundle_size = config.upload_zip_bundle_size
-        bundle_max_bytes = config.upload_zip_bundle_max_bytes
-
-        if compression_mode == 'zip':
-            if bundle_size > 0 or bundle_max_bytes > 0:
-                parts = []
-                if bundle_size > 0:
-                    parts.append(f"{bundle_size} pages")
-                if bundle_max_bytes > 0:
-                    parts.append(_format_size(bundle_max_bytes))
-                print(f"Scanning with ZIP bundling ({', '.join(parts)})...")
-            else:
-                print("Scanning pages (ZIP upload at end)...")
-        else:
-            print("Scanning and uploading pages as they complete...")
-
-        processed_files = []
+class ScanRunner:
+    """Runs scan jobs with components built once and reused between scans.
+
+    The uploader keeps its HTTP connection pool and the scanner its device
+    (and persistent SANE handle, if configured) across run() calls.
+    """
+
+    def __init__(self, config, debug=False, device=None):
+        """Initialize the runner.
+
+        Args:
+            config: Configuration object
+            debug: Print debug information while scanning
+            device: Optional scanner device name, used instead of scanner.device
+        """
+        self.config = config
+        self.debug = debug
+        self.file_manager = FileManager(config)
+        self.sound_player = SoundPlayer(config)
+        self.blank_detector = BlankPageDetector(config)
+        self.uploader = Uploader(config)
+        try:
+            self.scanner = Scanner(config, uploader=self.uploader, device=device)
+        except Exception:
+            self.uploader.close()
+            raise
+
+    def close(self):
+        """Release the scanner handle and pooled HTTP connections."""
+        self.scanner.close()
+        self.uploader.close()
+
+    def run(self, source=None, format_type=None, max_pages=None):
+        """Scan a document and upload to API.
+
+        Errors are reported on stdout rather than raised.
+
+        Returns:
+            True if the document was scanned and uploaded, False otherwise
+        """
+        config = self.config
+        debug = self.debug
+        uploader = self.uploader
+        scanner = self.scanner
+        blank_detector = self.blank_detector
+        sound_player = self.sound_player
+        upload_pool = None
+        page_uploads = []
+        bundle_uploads = []
         doc_id = None
-        uploaded_pages = 0
+        success = False
 
-        def page_callback(page_num, file_path):
-            """Called when each page is ready."""
-            nonlocal doc_id, uploaded_pages
+        self.file_manager.run_retention()
 
+        # The directory and any pages left in it are removed on every exit path
+        timestamp = time.strftime("%Y-%m-%d-%H%M%S", time.localtime())
+        with tempfile.TemporaryDirectory(prefix=f"{timestamp}-", dir=config.temp_dir) as scan_dir:
             if debug:
-                print(f"[Callback] Page {page_num} ready: {file_path}")
+                print(f"Scan directory: {scan_dir}")
+                print(f"Max pages: {max_pages}")
+                print(f"Color correction: {config.scanner_color_correction}")
+                print(f"Upload compression: {config.upload_compression}")
+                print(f"ZIP bundle size: {config.upload_zip_bundle_size}")
+                print(f"ZIP bundle max bytes: {config.upload_zip_bundle_max_bytes}")
+                print(f"Auto JPEG threshold: {config.upload_auto_jpeg_threshold}")
+                print(f"Auto JPEG page bytes: {config.upload_auto_jpeg_page_size_bytes}")
 
-            # Skip blank pages early (also removes the file)
-            if config.skip_blank and blank_detector.is_blank(file_path):
+            try:
                 if debug:
-                    print(f"[Callback] Page {page_num} is blank, removing")
-                blank_detector.remove_blank_files([file_path])
-                return
+                    print(f"Scanner device: {scanner.device}")
+                    print(f"Scanner source: {source or config.scanner_source}")
+                    print(f"Scanner mode: {config.scanner_mode}")
+        
+                compression_mode = config.upload_compression
+                bundle_size = config.upload_zip_bundle_size
+                bundle_max_bytes = config.upload_zip_bundle_max_bytes
 
-            file_size = os.path.getsize(file_path)
-            if debug:
-                print(f"[Callback] Page {page_num} size: {_format_size(file_size)}")
+                if compression_mode == 'zip':
+                    if bundle_size > 0 or bundle_max_bytes > 0:
+                        parts = []
+                        if bundle_size > 0:
+                            parts.append(f"{bundle_size} pages")
+                        if bundle_max_bytes > 0:
+                            parts.append(_format_size(bundle_max_bytes))
+                        print(f"Scanning with ZIP bundling ({', '.join(parts)})...")
+                    else:
+                        print("Scanning pages (ZIP upload at end)...")
+                else:
+                    print("Scanning and uploading pages as they complete...")
 
-            if compression_mode == 'zip':
-                processed_files.append(file_path)
-                return
+                processed_files = []
+                uploaded_pages = 0
 
-            # individual upload: create document with page 1 and append
-            try:
-                if page_num == 1:
-                    result = uploader.upload_document([file_path])
-                    doc_id = result.get('doc_id')
-                    uploaded_pages = 1
-                    print(f"Page 1 uploaded ({_format_size(file_size)}, ID: {doc_id})")
-                else:
-                    if not doc_id:
-                        raise Exception("No document ID for appending")
-                    uploader._append_pages(doc_id, [file_path])
-                    uploaded_pages += 1
-                    print(f"Page {page_num} uploaded ({_format_size(file_size)})")
-            except Exception as e:
-                print(f"Error uploading page {page_num}: {e}")
-
-        scanned_files = scanner.scan_pages(
-            scan_dir,
-            source=config.scanner_source,
-            page_callback=page_callback,
-            max_pages=max_pages
-        )
-
-        if debug:
-            print(f"[Scan] Total pages scanned: {len(scanned_files)}")
-
-        if not scanned_files:
-            print("Error: No pages scanned. Load paper in feeder.")
-            sys.exit(1)
-
-        if compression_mode == 'zip':
-            final_files = processed_files
-            if not final_files:
-                print("Error: All pages were blank or removed.")
-                sys.exit(1)
-
-            print(f"Uploading {len(final_files)} pages as ZIP...")
-            result = uploader.upload_document(final_files)
-            doc_id = result.get('doc_id')
-            bundles = result.get('bundles', 1)
-            payload = result.get('payload_human')
-            if payload:
-                print(f"ZIP uploaded ({len(final_files)} pages, {bundles} bundle(s), {payload}, ID: {doc_id})")
-            else:
-                print(f"ZIP uploaded ({len(final_files)} pages, {bundles} bundle(s), ID: {doc_id})")
-
-        print(f"Scan complete - {len(scanned_files)} pages processed")
-        sound_player.play_success()
+                # Individual uploads run on a background worker so the scanner can
+                # deliver the next page while the previous one is still in flight.
+                # A single worker keeps the appends in page order and guarantees
+                # page 1 has created the document before any append runs.
+                # ZIP bundles limited only by page count come out the same
+                # whether they are cut during or after the scan, so those are
+                # uploaded on the same worker as soon as each bundle is full.
+                pipeline_zip = (
+                    compression_mode == 'zip' and bundle_size > 0 and bundle_max_bytes <= 0
+                    and config.upload_auto_jpeg_threshold <= 0
+                )
+                if compression_mode != 'zip' or pipeline_zip:
+                    upload_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='piscan-upload')
+                bundle_results = []
+                bundled_pages = 0
+                bundle_failed = False
+
+                def upload_bundle(bundle):
+                    """Upload one ZIP bundle, creating the document with the first."""
+                    nonlocal doc_id, bundle_failed
+
+                    if bundle_failed:
+                        # Don't let a later bundle start a second document
+                        raise UploadError("Skipped after an earlier ZIP bundle failed")
+                    try:
+                        if not bundle_results:
+                            result = uploader.upload_document(bundle)
+                            doc_id = result.get('doc_id')
+                        elif not doc_id:
+                            # Creating another document would split the scan
+                            raise UploadError("Missing document ID for bundle append")
+                        else:
+                            result = uploader.append_document_zip(doc_id, bundle)
+                    except Exception:
+                        bundle_failed = True
+                        raise
+                    bundle_results.append(result)
+                    print(f"ZIP bundle {len(bundle_results)} uploaded ({len(bundle)} pages)")
+
+                def upload_page(page_num, file_path, file_size):
+                    """Upload a single page, creating the document for page 1."""
+                    nonlocal doc_id, uploaded_pages
+
+                    try:
+                        if page_num == 1:
+                            result = uploader.upload_document([file_path])
+                            doc_id = result.get('doc_id')
+                            uploaded_pages = 1
+                            print(f"Page 1 uploaded ({_format_size(file_size)}, ID: {doc_id})")
+                        else:
+                            if not doc_id:
+                                raise Exception("No document ID for appending")
+                            # Later pages are appended in groups to save round-trips
+                            result = uploader.append_pages_buffered(
+                                doc_id, file_path, flush_size=flush_size, flush_interval=flush_interval
+                            )
+                            uploaded_pages += 1
+                            if result is not None:
+                                print(f"Pages up to {page_num} uploaded")
+                            elif debug:
+                                print(f"[Upload] Page {page_num} queued ({_format_size(file_size)})")
+                    except Exception as e:
+                        print(f"Error uploading page {page_num}: {e}")
+
+                def flush_pages():
+                    """Append pages still queued after the scan has finished."""
+                    try:
+                        if uploader.flush() is not None:
+                            print("Remaining pages uploaded")
+                    except Exception as e:
+                        print(f"Error uploading pages: {e}")
+
+                # Settings read once per scan rather than once per page
+                skip_blank = config.skip_blank
+                is_blank = blank_detector.is_blank
+                zip_mode = compression_mode == 'zip'
+                flush_size = config.upload_append_flush_pages
+                flush_interval = config.upload_append_flush_interval
+                getsize = os.path.getsize
+
+                def page_callback(page_num, file_path):
+                    """Called when each page is ready."""
+                    nonlocal bundled_pages
+
+                    if debug:
+                        print(f"[Callback] Page {page_num} ready: {file_path}")
+
+                    # Skip blank pages early (also removes the file)
+                    if skip_blank and is_blank(file_path):
+                        if debug:
+                            print(f"[Callback] Page {page_num} is blank, removing")
+                        blank_detector.remove_blank_files([file_path])
+                        return
+
+                    if zip_mode:
+                        if debug:
+                            print(f"[Callback] Page {page_num} size: {_format_size(getsize(file_path))}")
+                        processed_files.append(file_path)
+                        if pipeline_zip and len(processed_files) - bundled_pages >= bundle_size:
+                            bundle = processed_files[bundled_pages:bundled_pages + bundle_size]
+                            bundled_pages += bundle_size
+                            bundle_uploads.append(upload_pool.submit(upload_bundle, bundle))
+                        return
+
+                    file_size = getsize(file_path)
+                    if debug:
+                        print(f"[Callback] Page {page_num} size: {_format_size(file_size)}")
+
+                    # individual upload: create document with page 1 and append
+                    page_uploads.append(upload_pool.submit(upload_page, page_num, file_path, file_size))
+
+                scanned_files = scanner.scan_pages(
+                    scan_dir,
+                    source=source,
+                    page_callback=page_callback,
+                    max_pages=max_pages,
+                    format_type=format_type,
+                )
+
+                if page_uploads:
+                    if debug:
+                        print(f"[Upload] Waiting for {len(page_uploads)} page upload(s)")
+                    wait(page_uploads)
+                    flush_pages()
+                if bundle_uploads:
+                    if debug:
+                        print(f"[Upload] Waiting for {len(bundle_uploads)} ZIP bundle upload(s)")
+                    wait(bundle_uploads)
+
+                if debug:
+                    print(f"[Scan] Total pages scanned: {len(scanned_files)}")
+
+                if not scanned_files:
+                    print("Error: No pages scanned. Load paper in feeder.")
+                    return False
+
+                if compression_mode == 'zip':
+                    final_files = processed_files
+                    if not final_files:
+                        print("Error: All pages were blank or removed.")
+                        return False
+
+                    if pipeline_zip:
+                        # Re-raise the first failed bundle, then send the rest
+                        for future in bundle_uploads:
+                            future.result()
+                        remaining = final_files[bundled_pages:]
+                        if remaining:
+                            print(f"Uploading last {len(remaining)} pages as ZIP...")
+                            upload_bundle(remaining)
+                        bundles = len(bundle_results)
+                        payload = _format_size(sum(r.get('payload_bytes') or 0 for r in bundle_results))
+                    else:
+                        print(f"Uploading {len(final_files)} pages as ZIP...")
+                        result = uploader.upload_document(final_files)
+                        doc_id = result.get('doc_id')
+                        bundles = result.get('bundles', 1)
+                        payload = result.get('payload_human')
+                    if payload:
+                        print(f"ZIP uploaded ({len(final_files)} pages, {bundles} bundle(s), {payload}, ID: {doc_id})")
+                    else:
+                        print(f"ZIP uploaded ({len(final_files)} pages, {bundles} bundle(s), ID: {doc_id})")
+
+                print(f"Scan complete - {len(scanned_files)} pages processed")
+                sound_player.play_success()
+                success = True
+                return True
         
-        for filepath in scanned_files:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-        if os.path.exists(scan_dir):
-            os.rmdir(scan_dir)
-            
-    except ScannerError as e:
-        print(f"Error: {e}")
-        if sound_player:
-            sound_player.play_error()
-        if debug:
-            import traceback
-            traceback.print_exc()
-        if os.path.exists(scan_dir):
-            for f in os.listdir(scan_dir):
-                os.remove(os.path.join(scan_dir, f))
-            os.rmdir(scan_dir)
-        sys.exit(1)
+            except ScannerError as e:
+                print(f"Error: {e}")
+                if sound_player:
+                    sound_player.play_error()
+                if debug:
+                    traceback.print_exc()
+                return False
         
-    except UploadError as e:
-        print(f"Error: {e}")
-        if sound_player:
-            sound_player.play_error()
-        if debug:
-            import traceback
-            traceback.print_exc()
-        if os.path.exists(scan_dir):
-            for f in os.listdir(scan_dir):
-                os.remove(os.path.join(scan_dir, f))
-            os.rmdir(scan_dir)
-        sys.exit(1)
+            except UploadError as e:
+                print(f"Error: {e}")
+                if sound_player:
+                    sound_player.play_error()
+                if debug:
+                    traceback.print_exc()
+                return False
         
-    except KeyboardInterrupt:
-        print("\nCancelled")
-        if os.path.exists(scan_dir):
-            for f in os.listdir(scan_dir):
-                os.remove(os.path.join(scan_dir, f))
-            os.rmdir(scan_dir)
-        sys.exit(1)
+            except KeyboardInterrupt:
+                print("\nCancelled")
+                return False
         
-    except Exception as e:
-        print(f"Error: {e}")
-        if sound_player:
-            sound_player.play_error()
-        if debug:
-            import traceback
-            traceback.print_exc()
-        if os.path.exists(scan_dir):
-            for f in os.listdir(scan_dir):
-                os.remove(os.path.join(scan_dir, f))
-            os.rmdir(scan_dir)
-        sys.exit(1)
+            except Exception as e:
+                print(f"Error: {e}")
+                if sound_player:
+                    sound_player.play_error()
+                if debug:
+                    traceback.print_exc()
+                return False
+
+            finally:
+                if upload_pool:
+                    for future in page_uploads + bundle_uploads:
+                        future.cancel()
+                    # A running upload still reads its pages from scan_dir,
+                    # which is removed once we leave the with block
+                    upload_pool.shutdown(wait=True)
+                if page_uploads:
+                    # Send or drop appends still queued for the same reason;
+                    # on success they were flushed already
+                    if not success:
+                        flush_pages()
+                    dropped = uploader.discard_pending()
+                    if dropped:
+                        print(f"Error: {len(dropped)} page(s) were not uploaded")
+                if doc_id and not success:
+                    print(f"Partial document left on server (ID: {doc_id})")
+
+
+def scan_document(config, source=None, format_type=None, debug=False, max_pages=None):
+    """Scan a document and upload to API.
+
+    Returns:
+        True if the document was scanned and uploaded, False otherwise
+    """
+    runner = ScanRunner(config, debug=debug)
+    try:
+        return runner.run(source, format_type, max_pages)
+    finally:
+        runner.close()
 
 
 def main():
@@ -221,16 +365,22 @@ def main():
         config_path = args.config or './config/config.yaml'
         config = Config(config_path)
         
-        # Run scan
-        scan_document(config, args.source, args.format_type, args.debug, args.pages)
+        # Build the scanner, uploader etc. once; run() can be called repeatedly
+        runner = ScanRunner(config, debug=args.debug)
+        try:
+            success = runner.run(args.source, args.format_type, args.pages)
+        finally:
+            runner.close()
         
     except Exception as e:
         print(f"Error: {e}")
         if args.debug:
-            import traceback
             traceback.print_exc()
         sys.exit(1)
 
+    if not success:
+        sys.exit(1)
+
 
 if __name__ == '__main__':
     main()
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import asyncio
 import time
 import subprocess
 import os
@@ -6,6 +7,11 @@ import sys
 import logging
 import signal
 
+try:
+    import sane
+except ImportError:
+    sane = None
+
 # Setup basic logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,20 +21,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger("piscan-monitor")
 
+# Scans run in this process and print their progress to our stdout;
+# flush it per line so it reaches the journal as it happens
+sys.stdout.reconfigure(line_buffering=True)
+
 # Add piscan module to path
 sys.path.insert(0, "/opt/piscan")
 from piscan.config import Config
+from piscan.scanner import open_shared_handle, close_shared_handle, sane_init
 from piscan.sound_player import SoundPlayer
+from scan import ScanRunner
 
 # Configuration
-SCAN_SCRIPT = "/opt/piscan/scan.py"
 CONFIG_PATH = "/opt/piscan/config/config.yaml"
 POLL_INTERVAL = 0.5  # Check every 500ms
+SANE_POLL_INTERVAL = 0.2  # Reading an option on an open handle is cheap
+IDLE_BACKOFF_AFTER = 300  # Double the poll interval every 5 min without a press...
+POLL_MAX_INTERVAL = 5.0  # ...up to this many seconds
 BUTTON_COOLDOWN = 2.0 # Ignore presses for 2s after a scan
+RECONNECT_INTERVAL = 5.0  # Retry opening a lost device every 5s
+WORK_SOUND = "/opt/piscan/sounds/computer_work_beep.mp3"
+DEVICE_CACHE = "/run/piscan/device"  # Last found device; tmpfs, so reset on reboot
 
 # Load config and sound player
 config = Config(CONFIG_PATH)
 sound_player = SoundPlayer(config)
+# Checked once; the sounds directory doesn't change while we run
+work_sound = WORK_SOUND if os.path.exists(WORK_SOUND) else None
+runner = None  # ScanRunner for the monitored device, created in main()
+# With the sane scan backend, scans run through the handle the buttons are
+# polled on, so it stays open across scans instead of being handed over
+SHARE_HANDLE = sane is not None and config.scanner_backend == 'sane'
 
 # Map physical buttons to scan sources
 # "start" is the main green button on Canon DR-F120
@@ -39,6 +62,13 @@ BUTTON_MAP = {
     "stop": "ADF Front",      # Fallback: Stop button -> Simplex (if user prefers)
 }
 
+# Button options we react to, in the order they are checked
+BUTTON_NAMES = ['start', 'stop', 'button-3', 'scan', 'button-1', 'button-2']
+BUTTON_NAME_SET = frozenset(BUTTON_NAMES)
+
+# Network proxies for the scanner, not the local device
+NETWORK_DEVICE_PREFIXES = ('net:', 'airscan', 'hpaio')
+
 # Signal handler for clean exit
 def signal_handler(sig, frame):
     logger.info("Stopping button monitor...")
@@ -51,97 +81,263 @@ def get_device_name():
     """Find the local scanner device (excluding network backends)."""
     try:
         # Use scanimage -L to find devices
-        result = subprocess.run(['scanimage', '-L'], capture_output=True, text=True, timeout=5)
+        result = subprocess.run(['scanimage', '-L'], capture_output=True, text=True, timeout=5, close_fds=False)
         for line in result.stdout.splitlines():
             # Example: device `canon_dr:libusb:003:003' is a CANON DR-F120 scanner
             if "device `" in line:
                 dev = line.split("`")[1].split("'")[0]
                 # Filter out network proxies if they exist
-                if not dev.startswith("net:") and not dev.startswith("airscan") and not dev.startswith("hpaio"):
+                if not dev.startswith(NETWORK_DEVICE_PREFIXES):
                     return dev
     except Exception as e:
         logger.error(f"Error finding device: {e}")
     return None
 
-def check_button(device):
+def read_cached_device():
+    """Return the device found by an earlier run, or None."""
+    try:
+        with open(DEVICE_CACHE) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def write_cached_device(device):
+    """Remember the device for the next start (best effort)."""
+    try:
+        os.makedirs(os.path.dirname(DEVICE_CACHE), exist_ok=True)
+        tmp_path = f"{DEVICE_CACHE}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(device + "\n")
+        os.replace(tmp_path, DEVICE_CACHE)
+    except OSError as e:
+        logger.warning(f"Cannot cache device name in {DEVICE_CACHE}: {e}")
+
+async def check_button(device):
     """Check if any button is pressed and return its name."""
     try:
         # Query device options
         # We assume the device is available since we are the only one accessing it
-        cmd = ['scanimage', '-d', device, '-A']
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
+        proc = await asyncio.create_subprocess_exec(
+            'scanimage', '-d', device, '-A',
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL, close_fds=False
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=2)
+        except asyncio.TimeoutError:
+            # Device might be busy or sleeping, just skip this poll
+            proc.kill()
+            await proc.wait()
+            return None
         
         # Look for button "yes" state
         # Matches: --start[=(yes|no)] [yes]
         # or: --button-3[=(yes|no)] [yes]
-        output = result.stdout
+        output = stdout.decode(errors='replace')
         
         if "[yes]" in output:
             for line in output.splitlines():
                 if "[yes]" in line:
                     # Extract option name: "    --start[=(yes|no)] [yes]" -> "start"
-                    # Regex match would be cleaner but split works for simple cases
                     if "--" in line and "[" in line:
-                        parts = line.split("--")[1].split("[")[0]
-                        btn_name = parts.strip()
-                        if btn_name in ['start', 'stop', 'button-3', 'scan', 'button-1', 'button-2']:
+                        btn_name = line.partition("--")[2].partition("[")[0].strip()
+                        if btn_name in BUTTON_NAME_SET:
                             return btn_name
         return None
-    except subprocess.TimeoutExpired:
-        # Device might be busy or sleeping, just skip this poll
-        return None
     except Exception as e:
         logger.error(f"Poll error: {e}")
         return None
 
-def trigger_scan(button_name):
-    """Run the main scan script with source based on button."""
+def open_button_handle(device, warn=True):
+    """Open the device with python-sane so buttons can be read without forking.
+
+    Args:
+        device: SANE device name
+        warn: Log a warning if the device cannot be opened
+
+    Returns:
+        Open SANE device, or None to fall back to polling with scanimage -A
+    """
+    if sane is None:
+        return None
+    try:
+        if SHARE_HANDLE:
+            return open_shared_handle(device)
+        sane_init()
+        return sane.open(device)
+    except Exception as e:
+        if warn:
+            logger.warning(f"Cannot open {device} via python-sane ({e}), polling with scanimage -A")
+        return None
+
+def close_button_handle(handle):
+    """Release a handle from open_button_handle()."""
+    if handle is None:
+        return
+    try:
+        if SHARE_HANDLE:
+            close_shared_handle()
+        else:
+            handle.close()
+    except Exception as e:
+        logger.error(f"Error closing device: {e}")
+
+def find_button_options(handle):
+    """Look up the SANE option index of each button the device provides.
+
+    Returns:
+        List of (button name, option index) in BUTTON_NAMES order
+    """
+    buttons = []
+    for name in BUTTON_NAMES:
+        # python-sane keys options by name with '-' mapped to '_'
+        opt = handle.opt.get(name.replace('-', '_'))
+        if opt is not None and opt.is_active():
+            buttons.append((name, opt.index))
+    return buttons
+
+def check_button_sane(handle, buttons):
+    """Check the button options on an open SANE handle and return the pressed one.
+
+    Reads each option by its cached index, a single sane_control_option()
+    call, skipping python-sane's per-read name lookup and activity check.
+
+    Raises:
+        Exception: python-sane errors, e.g. when the device was unplugged
+    """
+    get_option = handle.dev.get_option
+    for name, index in buttons:
+        if get_option(index):
+            return name
+    return None
+
+async def reconnect(device):
+    """Wait until the scanner can be opened again after it went away.
+
+    Reopens device, or the device scanimage -L finds if the scanner came
+    back under another name (e.g. a new USB address after a power cycle).
+
+    Returns:
+        Tuple of (device name, open SANE handle)
+    """
+    while True:
+        handle = open_button_handle(device, warn=False)
+        if handle is not None:
+            return device, handle
+        found = get_device_name()
+        if found and found != device:
+            handle = open_button_handle(found, warn=False)
+            if handle is not None:
+                logger.info(f"Scanner found as {found}")
+                write_cached_device(found)
+                runner.scanner.device = found
+                return found, handle
+        await asyncio.sleep(RECONNECT_INTERVAL)
+
+def poll_interval(base, idle_seconds):
+    """Return the poll interval after idle_seconds without a button press."""
+    steps = min(int(idle_seconds // IDLE_BACKOFF_AFTER), 16)
+    return min(POLL_MAX_INTERVAL, base * (2 ** steps))
+
+async def trigger_scan(button_name):
+    """Run a scan with the source based on button."""
     source = BUTTON_MAP.get(button_name, config.scanner_source)
     logger.info(f"=== Button '{button_name}' pressed! Starting scan (Source: {source})... ===")
     
     # Play acknowledgment sound immediately
     # We use a non-blocking "work" beep if available, or just the success sound as "start"
     # Assuming computer_work_beep.mp3 is available based on user feedback
-    work_sound = "/opt/piscan/sounds/computer_work_beep.mp3"
-    if os.path.exists(work_sound):
+    beep = None
+    if work_sound:
         # Manually play via aplay/mpg123 for speed, or use SoundPlayer private method
         # Let's use SoundPlayer public method if possible, but it only has success/error.
         # We'll stick to a quick ad-hoc play or verify if SoundPlayer exposes generic play.
         # It has _play_sound(file, type).
-        sound_player._play_sound(work_sound, "start")
+        # Played on a thread so a blocking player doesn't delay the scan start.
+        beep = asyncio.create_task(asyncio.to_thread(sound_player._play_sound, work_sound, "start"))
     
     try:
-        # Run scan.py in subprocess
-        # Override source via command line argument
-        cmd = [sys.executable, "-u", SCAN_SCRIPT, "--config", CONFIG_PATH, "--source", source]
-        
-        # We wait for it to finish so we don't poll during scanning
-        subprocess.run(cmd, check=False)
-        
-        logger.info("=== Scan process finished ===")
+        # Runs in-process with the already loaded config, on a worker thread
+        # so the event loop stays free. We wait for it to finish so we don't
+        # poll during scanning. run() reports errors itself.
+        if await asyncio.to_thread(runner.run, source):
+            logger.info("=== Scan finished ===")
+        else:
+            logger.info("=== Scan failed ===")
     except Exception as e:
-        logger.error(f"Failed to run scan script: {e}")
+        logger.error(f"Scan failed: {e}")
+
+    if beep is not None:
+        await beep
 
-def main():
+async def main():
+    global runner
     logger.info("Piscan Button Monitor started")
     
-    device = get_device_name()
-    if not device:
-        logger.error("No local scanner found! Retrying in 5s...")
-        time.sleep(5)
-        sys.exit(1) # Systemd will restart us
+    # Opening the device from the last run skips enumerating every SANE
+    # backend with scanimage -L, which is slow and happens on each restart.
+    # The cache is only trusted if python-sane can open the device.
+    device = read_cached_device()
+    handle = open_button_handle(device, warn=False) if device else None
+    if handle is None:
+        device = get_device_name()
+        if not device:
+            logger.error("No local scanner found! Retrying in 5s...")
+            await asyncio.sleep(5)
+            sys.exit(1) # Systemd will restart us
+        if sane is not None:
+            # Only read back through python-sane, so not worth writing without it
+            write_cached_device(device)
         
     logger.info(f"Monitoring device: {device}")
     logger.info(f"Button mapping: {BUTTON_MAP}")
+
+    # Built once for the monitored device, so scans skip device detection
+    # and reuse the uploader's open API connections
+    runner = ScanRunner(config, device=device)
+
+    # Keep the device open and read the button options directly; each
+    # scanimage -A poll would open and close the USB device instead
+    if handle is None:
+        handle = open_button_handle(device)
+    buttons = []
+    if handle is not None:
+        buttons = find_button_options(handle)
+        logger.info(f"Polling buttons via python-sane: {[name for name, _ in buttons]}")
+    idle_since = time.monotonic()
     
     while True:
-        btn = check_button(device)
+        if handle is not None:
+            try:
+                btn = check_button_sane(handle, buttons)
+            except Exception as e:
+                # Logged once; the handle is dead until the device is back
+                logger.error(f"Lost {device} ({e}), waiting for it to come back...")
+                close_button_handle(handle)
+                device, handle = await reconnect(device)
+                buttons = find_button_options(handle)
+                logger.info(f"Monitoring device: {device}")
+                idle_since = time.monotonic()
+                continue
+        else:
+            btn = await check_button(device)
         if btn:
-            trigger_scan(btn)
+            # scanimage opens the device itself, so release it for the scan.
+            # Polling pauses until the scan ends: the device is busy, and a
+            # second press must not start another scan.
+            if not SHARE_HANDLE:
+                close_button_handle(handle)
+            await trigger_scan(btn)
             # Cooldown to prevent double-triggering
-            time.sleep(BUTTON_COOLDOWN)
+            await asyncio.sleep(BUTTON_COOLDOWN)
+            # A failed scan closes the shared handle, so this may reopen it
+            handle = open_button_handle(device)
+            if handle is not None:
+                buttons = find_button_options(handle)
+            idle_since = time.monotonic()
         
-        time.sleep(POLL_INTERVAL)
+        # Back off while nobody uses the scanner; a press resets to full speed
+        base = SANE_POLL_INTERVAL if handle is not None else POLL_INTERVAL
+        await asyncio.sleep(poll_interval(base, time.monotonic() - idle_since))
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -4,11 +4,16 @@ import subprocess
 import re
 import sys
 
+# Option name and current value, e.g. "    --start[=(yes|no)] [no]" -> ("start", "no").
+# The optional "[=(...)]" part is the value syntax, not the value.
+BUTTON_LINE_RE = re.compile(r'--([\w-]+)[^\[]*(?:\[=[^\]]*\])?\s*\[([^\]]*)\]')
+BUTTON_KEYWORDS = ('button', 'start', 'stop', 'scan')
+
 def get_options():
     try:
         # Use first available device
         cmd = ['scanimage', '-A']
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5, close_fds=False)
         return result.stdout
     except Exception as e:
         print(f"Error reading options: {e}")
@@ -22,10 +27,12 @@ def parse_buttons(output):
     buttons = {}
     for line in output.splitlines():
         # Look for button-like options
-        if any(x in line for x in ['button', 'start', 'stop', 'scan']):
+        if '--' not in line:
+            continue
+        if any(x in line for x in BUTTON_KEYWORDS):
             # Clean up the line to extract value
             # Example: "    --start[=(yes|no)] [no]" -> key="start", val="no"
-            match = re.search(r'--([\w-]+).*?\[(.*?)\]', line)
+            match = BUTTON_LINE_RE.search(line)
             if match:
                 key = match.group(1)
                 val = match.group(2)
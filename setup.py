@@ -9,6 +9,7 @@ setup(
         "PyYAML>=6.0",
         "Flask>=2.3.0", 
         "requests>=2.31.0",
+        "requests-toolbelt>=1.0.0",
         "Pillow>=10.0.0",
     ],
     entry_points={
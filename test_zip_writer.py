@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test that ZIP archives from the built-in writer read back with zipfile."""
+
+import sys
+import os
+import io
+import tempfile
+import zipfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from piscan.config import Config
+from piscan.uploader import Uploader
+
+def test_zip_round_trip():
+    """Write stored and deflated entries, then read them back."""
+    print("=== Testing ZIP Writer Round Trip ===")
+
+    config = Config()
+    config._config['upload']['compression_algo'] = 'deflate'
+    uploader = Uploader(config)
+    try:
+        if not uploader._has_fast_zip_writer():
+            print("- isal not installed, nothing to test")
+            return
+
+        with tempfile.TemporaryDirectory() as test_dir:
+            pages = {
+                # Stored (already compressed) and deflated entries, one with
+                # a non-ASCII name, and an empty file
+                'page_001.jpg': os.urandom(300_000),
+                'page_002.png': b'piscan ' * 50_000,
+                'seite_ä.jpg': os.urandom(1_000),
+                'empty.jpg': b'',
+            }
+            paths = []
+            for name, content in pages.items():
+                path = os.path.join(test_dir, name)
+                with open(path, 'wb') as f:
+                    f.write(content)
+                paths.append(path)
+
+            archive = b''.join(uploader._iter_zip_fast(paths, 6))
+            with zipfile.ZipFile(io.BytesIO(archive)) as zipf:
+                assert zipf.testzip() is None
+                assert zipf.namelist() == list(pages)
+                for info in zipf.infolist():
+                    stored = info.filename.endswith('.jpg')
+                    expected = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+                    assert info.compress_type == expected, info.filename
+                    # Stored entries have no data descriptor
+                    assert bool(info.flag_bits & 0x08) != stored, info.filename
+                    assert zipf.read(info) == pages[info.filename], info.filename
+            print(f"✓ {len(pages)} entries read back ({len(archive)} bytes)")
+
+            # Local headers of stored entries carry the real CRC and sizes,
+            # which is what streaming readers rely on
+            with zipfile.ZipFile(io.BytesIO(archive)) as zipf:
+                for info in zipf.infolist():
+                    if info.compress_type != zipfile.ZIP_STORED:
+                        continue
+                    header = archive[info.header_offset:info.header_offset + 30]
+                    crc, compress_size, file_size = (
+                        int.from_bytes(header[14:18], 'little'),
+                        int.from_bytes(header[18:22], 'little'),
+                        int.from_bytes(header[22:26], 'little'),
+                    )
+                    assert (crc, compress_size, file_size) == (info.CRC, info.file_size, info.file_size)
+            print("✓ Stored entries have CRC and sizes in their local headers")
+    finally:
+        uploader.close()
+
+if __name__ == '__main__':
+    test_zip_round_trip()
+    print("\n🎉 SUCCESS")
@@ -64,7 +64,7 @@ def main() -> int:
     if args.list_alsa:
         import subprocess
 
-        subprocess.run(["aplay", "-l"])
+        subprocess.run(["aplay", "-l"], close_fds=False)
         return 0
 
     if args.blocking: